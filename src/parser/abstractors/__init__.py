@@ -2,3 +2,4 @@
 
 from .font import *
 from .position import *
+from .text import *
@@ -1,18 +1,16 @@
 # src/parser/abstractors/font.py
 
 # Standard Imports
-from typing import Text
+from functools import lru_cache
+import sys
+from typing import Text, Tuple
 
 # Third-Party Imports
 from pdfminer.layout import LTChar
 
 
 def get_fontname(character: LTChar) -> Text:
-    return (
-        character.fontname.split('+')[1]
-        if '+' in character.fontname
-        else character.fontname
-    )
+    return _parse_fontname(character.fontname)[0]
 
 
 def get_fontsize(character: LTChar) -> int:
@@ -20,18 +18,40 @@ def get_fontsize(character: LTChar) -> int:
 
 
 def get_fontweight(character: LTChar) -> Text:
-    font = get_fontname(character)
-    return (
-        font.split('-')[1]
-        if '-' in font
-        else 'Regular'
-    )
+    return _parse_fontname(character.fontname)[2]
 
 
 def get_typeface(character: LTChar) -> Text:
-    font = get_fontname(character)
-    return (
+    return _parse_fontname(character.fontname)[1]
+
+
+def parse_fontname(fontname: Text) -> Tuple[Text, Text, Text]:
+    """Split a raw fontname, such as those recorded by a CompactPage, into its name, typeface and weight."""
+    return _parse_fontname(fontname)
+
+
+@lru_cache(maxsize=1024)
+def _parse_fontname(fontname: Text) -> Tuple[Text, Text, Text]:
+    """Split a raw fontname into its name, typeface and weight.
+
+    A document only uses a handful of fonts, so each raw fontname is parsed
+    once and its parts are interned to be shared by every character.
+
+    This function is designed to help extract font attributes
+    and should not be imported into other modules."""
+    font = (
+        fontname.split('+')[1]
+        if '+' in fontname
+        else fontname
+    )
+    typeface = (
         font.split('-')[0]
         if '-' in font
         else font
     )
+    weight = (
+        font.split('-')[1]
+        if '-' in font
+        else 'Regular'
+    )
+    return sys.intern(font), sys.intern(typeface), sys.intern(weight)
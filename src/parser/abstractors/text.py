@@ -0,0 +1,36 @@
+# src/parser/abstractors/text.py
+
+# Standard Imports
+from typing import Text
+from weakref import WeakKeyDictionary
+
+# Third-Party Imports
+from pdfminer.layout import LTTextContainer
+
+# Normalized text is released as soon as its layout item is garbage collected
+_normalized: "WeakKeyDictionary[LTTextContainer, Text]" = WeakKeyDictionary()
+
+
+def get_normalized_text(container: LTTextContainer) -> Text:
+    """Extract text from an LTTextContainer without surrounding whitespace or line breaks.
+
+    The text of each container is built and normalized once, then reused by
+    every later call. Layout items are assumed not to change once their
+    layout has been analyzed."""
+    try:
+        return _normalized[container]
+    except KeyError:
+        text = _normalize(container)
+        _normalized[container] = text
+        return text
+    except TypeError:
+        # Objects which cannot be weakly referenced are never cached
+        return _normalize(container)
+
+
+def _normalize(container: LTTextContainer) -> Text:
+    """Strip surrounding whitespace and line breaks from the text of a container.
+
+    This function is designed to help extract normalized text
+    and should not be imported into other modules."""
+    return container.get_text().strip().replace('\n', '')
@@ -2,9 +2,10 @@
 
 # Standard Imports
 import statistics
-from typing import Text, Tuple, Union
+from typing import List, Optional, Sequence, Text, Tuple, Union
 
 # Third-Party Imports
+import numpy as np
 from pdfminer.layout import LTItem, LTAnno
 
 # Local Imports
@@ -42,6 +43,85 @@ def determine_alignment(*positions: Union[LTItem, Tuple]) -> Text:
     return min(stdev, key=stdev.get)
 
 
+def determine_alignments(
+    items: Sequence[Union[LTItem, Tuple]], divisions: Sequence[Tuple], axis: int = 1
+) -> List[Optional[Text]]:
+    """Return the alignment of the items between each division.
+
+    This is equivalent to calling determine_alignment() with the items
+    between each division, as selected by callbacks.between(division, axis),
+    but the standard deviations for every division are calculated together
+    in one vectorized pass."""
+    # Convert any LTItem to tuples of their positions
+    originals = [tuple(item) if isinstance(item, np.ndarray) else item for item in items]
+    positions = [
+        item if isinstance(item, Tuple) else (item.x0, item.y0, item.x1, item.y1)
+        for item in originals
+    ]
+    bboxes = np.array(positions, dtype=float).reshape(-1, 4)
+    bounds = np.array(divisions, dtype=float).reshape(-1, 2)
+
+    # Determine which items lie between each division
+    lower, upper = (0, 2) if axis == 1 else (1, 3)
+    members = (
+        (bboxes[np.newaxis, :, lower] >= bounds[:, np.newaxis, 0])
+        & (bboxes[np.newaxis, :, upper] <= bounds[:, np.newaxis, 1])
+    )
+    counts = members.sum(axis=1)
+
+    # Calculate the standard deviation of every alignment in every division
+    measures = np.stack([
+        bboxes[:, _ALIGNMENTS[alignment][0]] + bboxes[:, _ALIGNMENTS[alignment][1]]
+        for alignment in _ALIGNMENTS
+    ]) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = (measures[:, np.newaxis, :] * members).sum(axis=2) / counts
+        deviations = (measures[:, np.newaxis, :] - means[:, :, np.newaxis]) * members
+        stdevs = np.sqrt((deviations ** 2).sum(axis=2) / (counts - 1))
+
+    alignments = []
+    for idx in range(len(bounds)):
+        selected = np.flatnonzero(members[idx])
+
+        # Fewer than two items cannot be compared with one another
+        if len(selected) < 2:
+            alignments.append(determine_alignment(*[originals[i] for i in selected]))
+            continue
+
+        distribution = determine_distribution(*[positions[i] for i in selected])
+        if distribution == 'horizontal':
+            candidates = ['top', 'middle', 'bottom']
+        elif distribution == 'vertical':
+            candidates = ['left', 'center', 'right']
+        else:
+            alignments.append(None)
+            continue
+
+        # Prefer the first candidate when deviations differ only by rounding
+        deviation = {
+            alignment: stdevs[list(_ALIGNMENTS).index(alignment), idx]
+            for alignment in candidates
+        }
+        smallest = min(deviation.values())
+        alignments.append(next(
+            alignment for alignment in candidates
+            if np.isclose(deviation[alignment], smallest, rtol=1e-9, atol=1e-9)
+        ))
+
+    return alignments
+
+
+# Indexes of the bounding box edges averaged to measure each alignment
+_ALIGNMENTS = {
+    'left': (0, 0),
+    'bottom': (1, 1),
+    'right': (2, 2),
+    'top': (3, 3),
+    'center': (0, 2),
+    'middle': (1, 3),
+}
+
+
 def _calculate_stdev(alignment, *positions: Tuple) -> float:
     """Calculate the standard deviation.
 
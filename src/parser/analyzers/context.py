@@ -0,0 +1,54 @@
+# src/parser/analyzers/context.py
+
+# Standard Imports
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Text, Tuple
+
+# Third-Party Imports
+from pdfminer.layout import LTItem, LTTextLine
+
+# Local Imports
+from .. import callbacks as cb
+from ..selectors import select_lines
+
+
+class AnalysisContext:
+    """Memoize the results of analyzing the layout items of a page.
+
+    Analyzers which accept a context store their results under a key
+    describing the analysis, so that the same columns, rows, selections
+    or typography statistics are never computed twice for one page.
+    Keys include the layout items analyzed, compared by identity, so
+    analyses of different items never share a result."""
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+
+    def memoize(self, key: Hashable, function: Callable, *args, **kwargs) -> Any:
+        """Return the stored result for a key, computing it on first use.
+
+        Results are not stored when the key cannot be hashed."""
+        try:
+            hash(key)
+        except TypeError:
+            return function(*args, **kwargs)
+
+        if key not in self._results:
+            self._results[key] = function(*args, **kwargs)
+        return self._results[key]
+
+    @staticmethod
+    def key(name: Text, items: Any, *params: Hashable) -> Tuple:
+        """Return the key of an analysis of some layout items with the provided parameters."""
+        items = tuple(items) if isinstance(items, (tuple, list)) else (items,)
+        return (name, items, *params)
+
+
+def select_text_lines(
+    items: Iterable[LTItem], boundaries: Tuple = None, context: AnalysisContext = None
+) -> List[LTTextLine]:
+    """Select the non-blank lines within the boundaries, reusing any selection stored in the context."""
+    if context is not None:
+        key = context.key('lines', items, boundaries)
+        return context.memoize(key, select_text_lines, items, boundaries)
+
+    return select_lines(items, cb.text.not_blank(), region=boundaries)
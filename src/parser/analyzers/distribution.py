@@ -1,7 +1,8 @@
 # src/parser/analyzers/distribution.py
 
 # Standard Imports
-from typing import Text, Tuple, Union
+from operator import itemgetter
+from typing import Iterator, List, Text, Tuple, Union
 
 # Third-Party Imports
 from pdfminer.layout import LTItem, LTAnno
@@ -17,22 +18,61 @@ def determine_distribution(*positions: Union[LTItem, Tuple]) -> Text:
     if all(map(lambda pos: isinstance(pos, LTItem), positions)):
         positions = [(p.x0, p.y0, p.x1, p.y1) for p in positions if not isinstance(p, LTAnno)]
 
-    overlaps = []
-    for index, current in enumerate(positions):
-        for neighbor in positions[index + 1:]:
-            # Calculate horizontal and vertical overlap
-            overlaps.append((
-                _calculate_vertical_overlap(current, neighbor),
-                _calculate_horizontal_overlap(current, neighbor)
-            ))
-
-    # Use overlaps to determine whether alignment is more horizontal or more vertical
-    if all(map(lambda o: o[0] > o[1], overlaps)):
+    # Without any pairs to compare, the positions are treated as horizontal
+    if len(positions) < 2:
         return 'horizontal'
-    elif all(map(lambda o: o[0] < o[1], overlaps)):
+
+    # Ensure positions are all tuples
+    if not all(map(lambda pos: isinstance(pos, Tuple), positions)):
+        raise ValueError
+
+    # Positions are horizontal when every pair overlaps more vertically than
+    # horizontally; pairs which do not overlap horizontally only need to
+    # overlap vertically, so only horizontally overlapping pairs are compared
+    if _share_common_overlap(positions, axis=0) and all(
+        _calculate_vertical_overlap(*pair) > _calculate_horizontal_overlap(*pair)
+        for pair in _overlapping_pairs(positions, axis=1)
+    ):
+        return 'horizontal'
+
+    # Likewise, positions are vertical when every pair overlaps horizontally
+    # and vertically overlapping pairs overlap more horizontally
+    if _share_common_overlap(positions, axis=1) and all(
+        _calculate_vertical_overlap(*pair) < _calculate_horizontal_overlap(*pair)
+        for pair in _overlapping_pairs(positions, axis=0)
+    ):
         return 'vertical'
-    else:
-        return None
+
+    return None
+
+
+def _share_common_overlap(positions: List[Tuple], axis: int = 1) -> bool:
+    """Return whether every pair of positions overlaps along an axis.
+
+    Intervals overlap pairwise exactly when the latest start precedes the
+    earliest end, so this requires a single pass rather than every pair.
+
+    This function is designed to help determine distribution
+    and should not be imported into other modules."""
+    start, end = (0, 2) if axis == 1 else (1, 3)
+    return max(pos[start] for pos in positions) < min(pos[end] for pos in positions)
+
+
+def _overlapping_pairs(positions: List[Tuple], axis: int = 1) -> Iterator[Tuple[Tuple, Tuple]]:
+    """Yield pairs of positions which overlap along an axis.
+
+    Positions are swept from their starting edge, keeping only those which
+    have not yet ended, so pairs which cannot overlap are never visited.
+
+    This function is designed to help determine distribution
+    and should not be imported into other modules."""
+    start, end = (0, 2) if axis == 1 else (1, 3)
+    active = []
+    for position in sorted(positions, key=itemgetter(start)):
+        active = [other for other in active if other[end] > position[start]]
+        for other in active:
+            yield other, position
+        active.append(position)
 
 
 def _calculate_horizontal_overlap(first: Tuple, second: Tuple) -> float:
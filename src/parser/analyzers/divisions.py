@@ -12,23 +12,46 @@ from pdfminer.layout import LTContainer, LTItem, LTPage, LTRect, LTTextBox, LTTe
 
 # Local Imports
 from .. import callbacks as cb
-from .alignment import determine_alignment
+from .alignment import determine_alignments
+from .context import AnalysisContext, select_text_lines
+from ..models.page import CompactPage
 from ..reducers import reduce_positions
-from ..utils import estimate_bounding_box, merge_overlapping_positions
+from ..utils import IntervalSet, estimate_bounding_box, merge_overlapping_positions
 from ..selectors import select_lines, select_rectangles, select_textboxes
 
 
 def determine_column_positions(
-    *items: Union[LTItem, Tuple], boundaries: Tuple = None
+    *items: Union[LTItem, Tuple], boundaries: Tuple = None, context: AnalysisContext = None
 ) -> List[Tuple]:
-    """Determine the positions of columns using the provided layout items."""
+    """Determine the positions of columns using the provided layout items.
+
+    When a context is provided, columns already determined for the page are reused.
+    A CompactPage is not accepted, as the analysis walks layout objects."""
+    if any(isinstance(item, CompactPage) for item in items):
+        raise TypeError("a CompactPage is not a valid argument type, extract the pages without lean")
+
+    if context is not None:
+        return context.memoize(
+            context.key('columns', items, boundaries), _determine_column_positions, items, boundaries, context
+        )
+
+    return _determine_column_positions(items, boundaries)
+
+
+def _determine_column_positions(
+    items: Iterable[Union[LTItem, Tuple]], boundaries: Tuple = None, context: AnalysisContext = None
+) -> List[Tuple]:
+    """Determine the positions of columns using the provided layout items.
+
+    This function is designed to help determine the positions of
+    columns and should not be imported into other modules."""
     # If argument is an LTPage, use its child containers
     if len(items) == 1 and isinstance(items[0], LTPage):
         items = list(items[0])
 
     # If items are instances of LTItems, calculate column positions
     if all(map(lambda i: isinstance(i, LTItem), items)):
-        column_positions = _columns_from_layout(items, boundaries=boundaries)
+        column_positions = _columns_from_layout(items, boundaries=boundaries, context=context)
 
     # If positions are provided as tuples, extract the left and right sides of each
     elif all(map(lambda i: isinstance(i, Tuple), items)):
@@ -47,16 +70,37 @@ def determine_column_positions(
 
 
 def determine_row_positions(
-    *items: Union[LTContainer, Tuple], boundaries: Tuple = None
+    *items: Union[LTContainer, Tuple], boundaries: Tuple = None, context: AnalysisContext = None
 ) -> List[Tuple]:
-    """Determine the positions of rows using the provided layout items."""
+    """Determine the positions of rows using the provided layout items.
+
+    When a context is provided, rows already determined for the page are reused.
+    A CompactPage is not accepted, as the analysis walks layout objects."""
+    if any(isinstance(item, CompactPage) for item in items):
+        raise TypeError("a CompactPage is not a valid argument type, extract the pages without lean")
+
+    if context is not None:
+        return context.memoize(
+            context.key('rows', items, boundaries), _determine_row_positions, items, boundaries, context
+        )
+
+    return _determine_row_positions(items, boundaries)
+
+
+def _determine_row_positions(
+    items: Iterable[Union[LTContainer, Tuple]], boundaries: Tuple = None, context: AnalysisContext = None
+) -> List[Tuple]:
+    """Determine the positions of rows using the provided layout items.
+
+    This function is designed to help determine the positions of
+    rows and should not be imported into other modules."""
     # If argument is an LTPage, use its child containers
     if len(items) == 1 and isinstance(items[0], LTPage):
         items = list(items[0])
 
     # If items are instances of LTItems, calculate row positions
     if all(map(lambda i: isinstance(i, LTItem), items)):
-        row_positions = _rows_from_layout(items, boundaries=boundaries)
+        row_positions = _rows_from_layout(items, boundaries=boundaries, context=context)
 
     # If positions are provided as tuples, extract the top and bottom of each
     elif all(map(lambda i: isinstance(i, Tuple), items)):
@@ -77,7 +121,7 @@ def determine_row_positions(
 
 
 def _columns_from_layout(
-    items: Iterable[LTItem], boundaries: Tuple = None
+    items: Iterable[LTItem], boundaries: Tuple = None, context: AnalysisContext = None
 ) -> List[Tuple]:
     """Determine the positions of columns from LTItems.
 
@@ -94,26 +138,26 @@ def _columns_from_layout(
 
     This function was designed to help determine the positions of
     columns and should not be imported into other modules."""
-    column_positions = set()
+    column_positions = IntervalSet()
     # If columns have borders the page will contain LTRect objects
     # Even partial borders will allow us to determine column positions
     if rectangles := select_rectangles(
         items, cb.within(boundaries), lambda r: r.height > 1 and r.width < 1
     ):
         positions = _column_positions_from_rectangles(rectangles)
-        _update_positions(column_positions, positions)
+        column_positions.replace_parents(positions)
 
     # Otherwise, we'll need to rely on textboxes to estimate column positions
     # Without borders, these dimensions may not account for padding
     if textboxes := select_textboxes(items, cb.within(boundaries), cb.text.not_blank()):
         positions = _column_positions_from_textboxes(textboxes)
-        _update_positions(column_positions, positions)
+        column_positions.replace_parents(positions)
 
     # As a last resort, we'll also use textlines to estimate column positions
     # Without borders or textboxes, these dimensions may not account for padding
-    if textlines := select_lines(items, cb.within(boundaries), cb.text.not_blank()):
+    if textlines := select_text_lines(items, boundaries, context=context):
         positions = _column_positions_from_textlines(textlines)
-        _update_positions(column_positions, positions)
+        column_positions.replace_parents(positions)
 
     # Iterate over positions and remove overlapping columns
     unique_positions = merge_overlapping_positions(*column_positions)
@@ -124,11 +168,13 @@ def _columns_from_layout(
     # Expand columns to better fit margins and padding
     margins = itemgetter(0, 2)(estimate_bounding_box(*items))
     positions = _fit_columns_to_margins(sorted_positions, margins)
-    positions = _adjust_column_padding_based_on_alignment(positions, items)
+    positions = _adjust_column_padding_based_on_alignment(positions, items, context=context)
     return positions
 
 
-def _rows_from_layout(items: Iterable[LTItem], boundaries: Tuple = None) -> List[Tuple]:
+def _rows_from_layout(
+    items: Iterable[LTItem], boundaries: Tuple = None, context: AnalysisContext = None
+) -> List[Tuple]:
     """Determine the positions of rows from LTItems.
 
     Rows are discovered by analyzing LTItems in order of decreasing primacy:
@@ -144,12 +190,12 @@ def _rows_from_layout(items: Iterable[LTItem], boundaries: Tuple = None) -> List
 
     This function was designed to help determine the positions of
     rows and should not be imported into other modules."""
-    row_positions = set()
+    row_positions = IntervalSet()
     # Begin by using textboxes to narrow-down row positions
     # These dimensions typically exceed the actual size of rows
     if textboxes := select_textboxes(items, cb.within(boundaries), cb.text.not_blank()):
         positions = _row_positions_from_textboxes(textboxes)
-        _update_positions(row_positions, positions)
+        row_positions.replace_parents(positions)
 
     # If rows have borders the page will contain LTRect objects
     # However, we won't determine row positions with only partial borders
@@ -157,15 +203,16 @@ def _rows_from_layout(items: Iterable[LTItem], boundaries: Tuple = None) -> List
         items, cb.within(boundaries), lambda r: r.width > 1 and r.height < 1
     ):
         positions = _row_positions_from_rectangles(rectangles)
-        _update_positions(row_positions, positions)
+        row_positions.replace_parents(positions)
 
     # Otherwise, we'll need to rely on textlines to estimate row positions
     # Without borders, these dimensions may not account for padding
-    if textlines := select_lines(
-        items, cb.within(boundaries), cb.text.not_blank(), lambda l: l.height > 1
-    ):
+    if textlines := [
+        line for line in select_text_lines(items, boundaries, context=context)
+        if line.height > 1
+    ]:
         positions = _row_positions_from_textlines(textlines)
-        _update_positions(row_positions, positions)
+        row_positions.replace_parents(positions)
 
     # Iterate over positions and remove overlapping rows
     unique_positions = merge_overlapping_positions(*row_positions)
@@ -175,7 +222,7 @@ def _rows_from_layout(items: Iterable[LTItem], boundaries: Tuple = None) -> List
     assert all(map(lambda pos: isinstance(pos, tuple), sorted_positions))
 
     # Expand rows to better fit padding
-    positions = _adjust_row_padding_based_on_alignment(sorted_positions, items)
+    positions = _adjust_row_padding_based_on_alignment(sorted_positions, items, context=context)
     return positions
 
 
@@ -363,17 +410,6 @@ def _rows_from_positions(
     return sorted_positions
 
 
-def _update_positions(found: set, new: list) -> set:
-    """Update set of positions after checking whether any will be overwritten.
-
-    This function is designed to help determine the positions of
-    columns and should not be imported into other modules."""
-    children = lambda pos: list(filter(cb.between(pos, axis=0), new))
-    remove = [position for position in found if len(children(position)) > 1]
-    found.difference_update(set(remove))
-    found.update(new)
-
-
 def _fit_columns_to_margins(columns, margins):
     """Expand left and right sides of columns to fit margins."""
     expanded_columns = (
@@ -388,12 +424,10 @@ def _fit_columns_to_margins(columns, margins):
     return expanded_columns
 
 
-def _adjust_column_padding_based_on_alignment(columns, items):
+def _adjust_column_padding_based_on_alignment(columns, items, context=None):
     """Expand column edges to reflect cell padding."""
-    alignments = []
-    for column in columns:
-        textlines = select_lines(items, cb.between(column), cb.text.not_blank())
-        alignments.append(determine_alignment(*textlines))
+    textlines = select_text_lines(items, context=context)
+    alignments = determine_alignments(textlines, columns, axis=1)
 
     expanded_columns = []
     for idx, col in enumerate(columns):
@@ -423,12 +457,10 @@ def _adjust_column_padding_based_on_alignment(columns, items):
     return expanded_columns
 
 
-def _adjust_row_padding_based_on_alignment(rows, items):
+def _adjust_row_padding_based_on_alignment(rows, items, context=None):
     """Expand row edges to reflect cell padding."""
-    alignments = []
-    for row in rows:
-        textlines = select_lines(items, cb.between(row, axis=0), cb.text.not_blank())
-        alignments.append(determine_alignment(*textlines))
+    textlines = select_text_lines(items, context=context)
+    alignments = determine_alignments(textlines, rows, axis=0)
 
     expanded_rows = []
     for idx, row in enumerate(rows):
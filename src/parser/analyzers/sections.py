@@ -9,23 +9,34 @@ from pdfminer.layout import LTItem, LTTextContainer, LTTextLine
 # Local Imports
 from .. import callbacks as cb
 from ..abstractors.position import get_position
+from .context import AnalysisContext, select_text_lines
 from .distribution import determine_distribution
 from .divisions import determine_column_positions, determine_row_positions
+from ..models.page import CompactPage
 from ..selectors import select_lines
 from ..utils import (
     merge_positions,
     merge_overlapping_positions,
-    most_common_fontname,
-    most_common_fontsize
+    most_common_fonts_by_line,
+    profile_typography
 )
 
 
-def determine_header_positions(*items: LTItem, boundaries: Tuple = None) -> Tuple:
-    """Determine the position of the table header using the provided elements."""
+def determine_header_positions(
+    *items: LTItem, boundaries: Tuple = None, context: AnalysisContext = None
+) -> Tuple:
+    """Determine the position of the table header using the provided elements.
+
+    When a context is provided, the columns, lines and typography already
+    analyzed for the page are reused. A CompactPage is not accepted,
+    as the analysis walks layout objects."""
+    if any(isinstance(item, CompactPage) for item in items):
+        raise TypeError("a CompactPage is not a valid argument type, extract the pages without lean")
+
     header_positions = set()
-    header_positions.update(_headers_from_dimensions(*items, boundaries=boundaries))
-    header_positions.update(_headers_from_relative_position(*items, boundaries=boundaries))
-    header_positions.update(_headers_from_typography(*items, boundaries=boundaries))
+    header_positions.update(_headers_from_dimensions(*items, boundaries=boundaries, context=context))
+    header_positions.update(_headers_from_relative_position(*items, boundaries=boundaries, context=context))
+    header_positions.update(_headers_from_typography(*items, boundaries=boundaries, context=context))
 
     # Iterate over header positions and merge any that overlap
     unique_headers = merge_overlapping_positions(*header_positions)
@@ -51,33 +62,39 @@ def determine_title_position(*elements: LTItem, boundaries: Tuple = None) -> Tup
     pass
 
 
-def _headers_from_dimensions(*items : LTItem, boundaries: Tuple = None) -> List:
+def _headers_from_dimensions(
+    *items : LTItem, boundaries: Tuple = None, context: AnalysisContext = None
+) -> List:
     """Determine the positions of headers from the dimensions of text.
 
     This function is designed to help determine the positions of
     headers and should not be imported into other modules."""
     line_positions = [
         get_position(line)
-        for line in _dimensionally_differentiated_text(items, cb.within(boundaries), cb.text.not_blank())
+        for line in _dimensionally_differentiated_text(items, boundaries, context=context)
     ]
     header_positions = merge_overlapping_positions(*line_positions)
     return header_positions
 
 
-def _headers_from_typography(*items : LTItem, boundaries: Tuple = None) -> List:
+def _headers_from_typography(
+    *items : LTItem, boundaries: Tuple = None, context: AnalysisContext = None
+) -> List:
     """Determine the positions of headers from the font styles of text.
 
     This function is designed to help determine the positions of
     headers and should not be imported into other modules."""
     line_positions = [
         get_position(line)
-        for line in _stylistically_differentiated_text(items, cb.within(boundaries), cb.text.not_blank())
+        for line in _stylistically_differentiated_text(items, boundaries, context=context)
     ]
     header_positions = merge_overlapping_positions(*line_positions)
     return header_positions
 
 
-def _headers_from_relative_position(*items : LTItem, boundaries: Tuple = None) -> List:
+def _headers_from_relative_position(
+    *items : LTItem, boundaries: Tuple = None, context: AnalysisContext = None
+) -> List:
     """Determine the positions of headers from the relative position of text.
 
     This function is designed to help determine the positions of
@@ -85,25 +102,36 @@ def _headers_from_relative_position(*items : LTItem, boundaries: Tuple = None) -
     line_positions = [
         get_position(
             _positionally_differentiated_text(items, cb.between(column, axis=1))
-        ) for column in determine_column_positions(*items, boundaries=boundaries)
+        ) for column in determine_column_positions(*items, boundaries=boundaries, context=context)
     ]
     header_positions = merge_overlapping_positions(*line_positions)
     return header_positions
 
 
-def _dimensionally_differentiated_text(container: LTTextContainer, *callbacks: Callable) -> List:
+def _dimensionally_differentiated_text(
+    container: LTTextContainer, boundaries: Tuple = None, context: AnalysisContext = None
+) -> List:
     """Determine the positions of text items which differ in fontsize from the average.
 
     This function is designed to help determine the positions of
     headers and should not be imported into other modules."""
     # Retrieve the most common fontsize used throughout the container.
-    most_common_size = most_common_fontsize(container)
+    profile = _memoize(
+        context, AnalysisContext.key('typography', container), profile_typography, container
+    )
+    most_common_size = profile.most_common_fontsize()
 
     # Check the font of each textline for differences
     divergent_lines = []
-    textlines = select_lines(container, *callbacks)
+    textlines = select_text_lines(container, boundaries, context=context)
+    line_fonts = _memoize(
+        context,
+        AnalysisContext.key('line fonts', container, boundaries),
+        most_common_fonts_by_line,
+        textlines
+    )
     for line in textlines:
-        line_size = most_common_fontsize(line)
+        _, line_size = line_fonts.get(line, (None, None))
         if line_size != most_common_size:
             divergent_lines.append(line)
 
@@ -122,20 +150,41 @@ def _positionally_differentiated_text(container: LTTextContainer, *callbacks: Ca
     return max(textlines, key=lambda ln: ln.y1)
 
 
-def _stylistically_differentiated_text(container: LTTextContainer, *callbacks: Callable) -> List:
+def _stylistically_differentiated_text(
+    container: LTTextContainer, boundaries: Tuple = None, context: AnalysisContext = None
+) -> List:
     """Determine the positions of text items which differ in style from the average.
 
     This function is designed to help determine the positions of
     headers and should not be imported into other modules."""
     # Retrieve the most common font used throughout the container.
-    most_common_font = most_common_fontname(container)
+    profile = _memoize(
+        context, AnalysisContext.key('typography', container), profile_typography, container
+    )
+    most_common_font = profile.most_common_fontname()
 
     # Check the font of each textline for differences
     divergent_lines = []
-    textlines = select_lines(container, *callbacks)
+    textlines = select_text_lines(container, boundaries, context=context)
+    line_fonts = _memoize(
+        context,
+        AnalysisContext.key('line fonts', container, boundaries),
+        most_common_fonts_by_line,
+        textlines
+    )
     for line in textlines:
-        line_font = most_common_fontname(line)
+        line_font, _ = line_fonts.get(line, (None, None))
         if line_font != most_common_font:
             divergent_lines.append(line)
 
     return divergent_lines
+
+
+def _memoize(context: AnalysisContext, key: Tuple, function: Callable, *args):
+    """Call a function, storing its result in the context when one is provided.
+
+    This function is designed to help determine the positions of
+    headers and should not be imported into other modules."""
+    if context is None:
+        return function(*args)
+    return context.memoize(key, function, *args)
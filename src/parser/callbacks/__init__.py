@@ -3,5 +3,7 @@
 from . import length
 from . import text
 from .between import between
+from .compose import compose, mask
 from .contains import contains
+from .intersects import intersects
 from .within import within
@@ -41,4 +41,5 @@ def between(boundary: Tuple = None, axis: int = 1, margin: int = 0) -> bool:
             bbox[1] <= boundary[1] + margin      # right or top
         )
 
+    callback.spec = ('between', boundary, axis, margin)
     return callback
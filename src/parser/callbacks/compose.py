@@ -0,0 +1,203 @@
+# src/parser/callbacks/compose.py
+
+# Standard Imports
+from math import inf
+from typing import Callable, List, Tuple, Union
+
+# Third-Party Imports
+import numpy as np
+from pdfminer.layout import LTItem
+
+# Local Imports
+from ..abstractors import get_normalized_text
+
+
+def compose(*callbacks: Callable) -> Callable:
+    """
+    Returns a single callback function that checks whether a layout item passes every provided callback.
+
+    Callbacks created by within(), between(), intersects(), text.equals(),
+    text.does_not_equal(), text.includes() and the length callbacks are fused
+    into one comparison of the item's bounding box, text and length. Any other
+    callbacks are called afterwards in the order they were provided.
+    :param callbacks: callback functions to combine.
+    :returns: a callback function.
+    """
+    # A composed callback can be reused as it is
+    if len(callbacks) == 1 and hasattr(callbacks[0], 'constraints'):
+        return callbacks[0]
+
+    constraints = _Constraints(callbacks)
+    lower, upper = tuple(constraints.lower), tuple(constraints.upper)
+    geometric = tuple(constraints.geometric)
+    equals, excludes, includes = constraints.equals, constraints.excludes, constraints.includes
+    longer, shorter, lengths = constraints.longer, constraints.shorter, constraints.lengths
+    others = tuple(constraints.others)
+
+    def callback(item: Union[LTItem, Tuple]):
+        """Checks a layout item against all of the fused callbacks."""
+        if geometric:
+            # Positions may be passed directly, in which case each callback interprets them
+            if isinstance(item, Tuple):
+                if not all(map(lambda cb: cb(item), geometric)):
+                    return False
+
+            else:
+                try:
+                    x0, y0, x1, y1 = item.x0, item.y0, item.x1, item.y1
+                except AttributeError:
+                    raise ValueError(f"{item!s} is not a valid argument type") from None
+
+                if not (
+                    lower[0] <= x0 <= upper[0] and  # left side
+                    lower[1] <= y0 <= upper[1] and  # bottom side
+                    lower[2] <= x1 <= upper[2] and  # right side
+                    lower[3] <= y1 <= upper[3]      # top side
+                ):
+                    return False
+
+        if lengths or longer is not None or shorter is not None:
+            length = len(item)
+            if (
+                (longer is not None and length <= longer)
+                or (shorter is not None and length >= shorter)
+                or any(map(lambda value: length != value, lengths))
+            ):
+                return False
+
+        if equals or excludes or includes:
+            if not hasattr(item, 'get_text'):
+                raise TypeError
+
+            text = get_normalized_text(item)
+            if (
+                any(map(lambda value: text != value, equals))
+                or text in excludes
+                or not all(map(lambda value: value in text, includes))
+            ):
+                return False
+
+        return all(map(lambda cb: cb(item), others))
+
+    callback.constraints = constraints
+    return callback
+
+
+def mask(bboxes: np.ndarray, *callbacks: Callable) -> np.ndarray:
+    """
+    Returns a boolean array marking which bounding boxes pass every provided callback.
+
+    Only callbacks created by within(), between() and intersects() can be
+    evaluated over an array of positions.
+    :param bboxes: array with one row of left, bottom, right and top positions per item.
+    :param callbacks: callback functions to combine.
+    :returns: a boolean array.
+    """
+    constraints = compose(*callbacks).constraints
+    if not constraints.is_geometric():
+        raise ValueError("only positional callbacks can be evaluated over an array")
+
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    return np.all(
+        (bboxes >= np.array(constraints.lower)) & (bboxes <= np.array(constraints.upper)),
+        axis=1
+    )
+
+
+class _Constraints:
+    """Collect the conditions described by a set of callbacks.
+
+    This class is designed to help compose callbacks
+    and should not be imported into other modules."""
+
+    def __init__(self, callbacks: Tuple[Callable]):
+        self.lower: List[float] = [-inf] * 4
+        self.upper: List[float] = [inf] * 4
+        self.geometric: List[Callable] = []
+        self.equals: List[str] = []
+        self.excludes: set = set()
+        self.includes: List[str] = []
+        self.longer: int = None
+        self.shorter: int = None
+        self.lengths: List[int] = []
+        self.others: List[Callable] = []
+        self.fused: List[Callable] = []
+
+        for callback in callbacks:
+            self.add(callback)
+
+    def add(self, callback: Callable) -> None:
+        """Record the conditions of a single callback."""
+        if hasattr(callback, 'constraints'):
+            for original in callback.constraints.callbacks():
+                self.add(original)
+            return
+
+        spec = getattr(callback, 'spec', None)
+        if spec is None:
+            self.others.append(callback)
+            return
+
+        name, *args = spec
+        if name in ('within', 'between', 'intersects'):
+            self._add_bounds(callback, name, *args)
+        elif name == 'text.equals':
+            self.equals.append(args[0])
+        elif name == 'text.does_not_equal':
+            self.excludes.add(args[0])
+        elif name == 'text.includes':
+            self.includes.extend(args[0])
+        elif name == 'length.equals':
+            self.lengths.append(args[0])
+        elif name == 'length.greater_than':
+            self.longer = args[0] if self.longer is None else max(self.longer, args[0])
+        elif name == 'length.less_than':
+            self.shorter = args[0] if self.shorter is None else min(self.shorter, args[0])
+        else:
+            self.others.append(callback)
+            return
+
+        self.fused.append(callback)
+
+    def callbacks(self) -> List[Callable]:
+        """Return the callbacks the conditions were collected from."""
+        return self.fused + self.others
+
+    def is_geometric(self) -> bool:
+        """Return whether every condition concerns the position of an item."""
+        return not (
+            self.equals or self.excludes or self.includes or self.lengths or self.others
+            or self.longer is not None or self.shorter is not None
+        )
+
+    def _add_bounds(self, callback: Callable, name: str, boundary: Tuple, *args) -> None:
+        # Callbacks without a boundary accept every item
+        if not boundary:
+            return
+
+        self.geometric.append(callback)
+        if name == 'within':
+            margin, = args
+            self._raise_lower(0, boundary[0] - margin)
+            self._raise_lower(1, boundary[1] - margin)
+            self._lower_upper(2, boundary[2] + margin)
+            self._lower_upper(3, boundary[3] + margin)
+
+        elif name == 'between':
+            axis, margin = args
+            start, end = (0, 2) if axis == 1 else (1, 3)
+            self._raise_lower(start, boundary[0] - margin)
+            self._lower_upper(end, boundary[1] + margin)
+
+        elif name == 'intersects':
+            margin, = args
+            self._lower_upper(0, boundary[2] + margin)
+            self._lower_upper(1, boundary[3] + margin)
+            self._raise_lower(2, boundary[0] - margin)
+            self._raise_lower(3, boundary[1] - margin)
+
+    def _raise_lower(self, index: int, value: float) -> None:
+        self.lower[index] = max(self.lower[index], value)
+
+    def _lower_upper(self, index: int, value: float) -> None:
+        self.upper[index] = min(self.upper[index], value)
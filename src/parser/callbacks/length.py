@@ -18,6 +18,7 @@ def equals(length: int) -> bool:
         """Checks whether an element is the provided length."""
         return len(element) == length
 
+    callback.spec = ('length.equals', length)
     return callback
 
 
@@ -32,6 +33,7 @@ def greater_than(length: int) -> bool:
         """Checks whether an element is greater than the provided length."""
         return len(element) > length
 
+    callback.spec = ('length.greater_than', length)
     return callback
 
 
@@ -46,4 +48,5 @@ def less_than(length: int) -> bool:
         """Checks whether an element is less than the provided length."""
         return len(element) < length
 
+    callback.spec = ('length.less_than', length)
     return callback
@@ -6,6 +6,9 @@ from typing import List, Text, Union
 # Third-Party Imports
 from pdfminer.layout import LTTextContainer
 
+# Local Imports
+from ..abstractors import get_normalized_text
+
 
 def equals(text: Text) -> bool:
     """
@@ -19,10 +22,11 @@ def equals(text: Text) -> bool:
     def callback(element: LTTextContainer):
         """Checks whether an element's text matches the provided text."""
         if hasattr(element, 'get_text'):
-            return text == element.get_text().strip().replace('\n', '')
+            return text == get_normalized_text(element)
         else:
             raise TypeError
 
+    callback.spec = ('text.equals', text)
     return callback
 
 
@@ -39,10 +43,11 @@ def does_not_equal(text: Text) -> bool:
     def callback(element: LTTextContainer):
         """Checks whether an element's text does not match the provided text."""
         if hasattr(element, 'get_text'):
-            return text != element.get_text().strip().replace('\n', '')
+            return text != get_normalized_text(element)
         else:
             raise TypeError
 
+    callback.spec = ('text.does_not_equal', text)
     return callback
 
 
@@ -58,9 +63,10 @@ def includes(*strings: Text) -> bool:
         if not hasattr(container, 'get_text'):
             raise TypeError
 
-        text = container.get_text().strip().replace('\n', '')
+        text = get_normalized_text(container)
         return all(map(lambda s: s in text, strings))
 
+    callback.spec = ('text.includes', strings)
     return callback
 
 
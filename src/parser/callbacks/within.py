@@ -42,4 +42,5 @@ def within(boundary: Tuple = None, margin: float = 0) -> bool:
             bbox[3] <= boundary[3] + margin      # top side
         )
 
+    callback.spec = ('within', boundary, margin)
     return callback
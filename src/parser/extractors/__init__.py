@@ -1,4 +1,7 @@
 # src/parser/extractors/__init__.py
 
+from .cache import LayoutCache
+from .devices import CompositeDevice, LeanPageDevice
+from .document import Document
 from .pages import extract_pages
 from .text import extract_text
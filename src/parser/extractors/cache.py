@@ -0,0 +1,177 @@
+# src/parser/extractors/cache.py
+
+# Standard Imports
+import hashlib
+import os
+import pickle
+import tempfile
+import time
+from typing import BinaryIO, List, Optional, Text, Union
+
+# Third-Party Imports
+import pdfminer
+from pdfminer.layout import LAParams, LTPage
+
+# Increment whenever the structure of cached layouts changes
+CACHE_VERSION = 1
+
+# Rescan the directory after this many writes, to account for other processes
+EVICTION_INTERVAL = 64
+
+# Temporary files older than this are left over from interrupted writes
+STALE_AGE = 60 * 60
+
+
+class LayoutCache:
+    """A size-bounded cache of analyzed page layouts stored on disk.
+
+    Layouts are keyed by the content hash of the document, the page number,
+    the layout analysis parameters and the library versions. The object ids
+    of each document's pages are stored alongside its layouts, so a page can
+    be located without walking the page tree again. When the total
+    size of the cache exceeds its limit, the least recently used layouts are
+    removed first. The size is tracked as layouts are written, and the
+    directory is only scanned when the limit is exceeded or once every
+    few writes, when temporary files left by interrupted writes are also
+    counted and removed.
+
+    Layouts are stored with pickle, so loading them can run arbitrary code.
+    The directory is created readable by its owner only, and an existing
+    directory must only be writable by trusted users."""
+
+    def __init__(self, directory: Union[Text, os.PathLike], max_size: int = 512 * 1024 * 1024):
+        self.directory = os.fspath(directory)
+        self.max_size = max_size
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        self._size: Optional[int] = None
+        self._writes = 0
+
+    def get(self, key: Text) -> Optional[LTPage]:
+        """Return the cached layout for a key, or None when it is missing."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as file:
+                layout = pickle.load(file)
+
+            # Mark the layout as recently used
+            os.utime(path)
+
+        # Layouts may be evicted by another process at any moment
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        return layout
+
+    def put(self, key: Text, layout: LTPage) -> None:
+        """Store a layout, then evict layouts until the cache fits its limit."""
+        # Write to a temporary file first so readers never see partial layouts
+        path = self._path(key)
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                pickle.dump(layout, file, protocol=pickle.HIGHEST_PROTOCOL)
+                size = file.tell()
+            replaced = _file_size(path)
+            os.replace(temp_path, path)
+        except BaseException:
+            _remove(temp_path)
+            raise
+
+        # Only scan the directory when the limit may have been exceeded
+        self._writes += 1
+        if self._size is not None:
+            self._size += size - replaced
+        if self._size is None or self._size > self.max_size or self._writes >= EVICTION_INTERVAL:
+            self._evict()
+
+    def get_page_index(self, digest: Text) -> Optional[List[int]]:
+        """Return the object ids of the pages of a document, or None when they are missing."""
+        return self.get(self._index_key(digest))
+
+    def put_page_index(self, digest: Text, objids: List[int]) -> None:
+        """Store the object ids of the pages of a document, in page order."""
+        self.put(self._index_key(digest), objids)
+
+    @staticmethod
+    def make_key(digest: Text, page_number: int, laparams: LAParams, variant: Text = '') -> Text:
+        """Return the key for a page of a document analyzed with the provided parameters.
+
+        Layouts built in another form, such as compact pages, are told apart by a variant."""
+        params = sorted(vars(laparams).items()) if laparams else []
+        components = (CACHE_VERSION, pdfminer.__version__, digest, page_number, params)
+        if variant:
+            components += (variant,)
+        return hashlib.sha256(repr(components).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def hash_document(file: BinaryIO) -> Text:
+        """Return the content hash of a document, leaving the file at its start."""
+        file.seek(0)
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+        file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _index_key(digest: Text) -> Text:
+        """Return the key for the page index of a document."""
+        components = (CACHE_VERSION, pdfminer.__version__, digest, 'pages')
+        return hashlib.sha256(repr(components).encode('utf-8')).hexdigest()
+
+    def _path(self, key: Text) -> Text:
+        """Return the path of the file holding a cached layout."""
+        return os.path.join(self.directory, f"{key}.layout")
+
+    def _evict(self) -> None:
+        """Remove the least recently used layouts until the cache fits its limit."""
+        entries = []
+        total_size = 0
+        stale_before = time.time() - STALE_AGE
+        for entry in os.scandir(self.directory):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+
+            if entry.name.endswith('.layout'):
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+                total_size += stat.st_size
+
+            # Count temporary files being written, and remove those left behind
+            elif entry.name.endswith('.tmp'):
+                if stat.st_mtime < stale_before:
+                    _remove(entry.path)
+                else:
+                    total_size += stat.st_size
+
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            _remove(path)
+            total_size -= size
+
+        self._size = total_size
+        self._writes = 0
+
+
+def _file_size(path: Text) -> int:
+    """Return the size of a file, or zero when it does not exist.
+
+    This function is designed to help cache layouts
+    and should not be imported into other modules."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _remove(path: Text) -> None:
+    """Remove a file, ignoring files already removed by another process.
+
+    This function is designed to help cache layouts
+    and should not be imported into other modules."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
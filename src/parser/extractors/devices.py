@@ -0,0 +1,137 @@
+# src/parser/extractors/devices.py
+
+# Standard Imports
+from array import array
+from typing import List, Optional
+
+# Third-Party Imports
+import numpy as np
+from pdfminer.converter import PDFLayoutAnalyzer
+from pdfminer.layout import LAParams, LTPage
+from pdfminer.pdfcolor import PDFColorSpace
+from pdfminer.pdffont import PDFFont, PDFUnicodeNotDefined
+from pdfminer.pdfinterp import PDFGraphicState, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.utils import Matrix, apply_matrix_rect
+
+# Local Imports
+from ..models.page import CompactPage
+
+
+class CompositeDevice(PDFLayoutAnalyzer):
+    """A device which forwards each analyzed page to several receivers.
+
+    The content stream of a page is interpreted and its layout analyzed
+    once, after which the layout is passed to the receive_layout() method
+    of every receiver in turn. Any pdfminer.six layout analyzer, such as a
+    PDFPageAggregator or TextConverter, can be used as a receiver, so
+    requesting several outputs costs a single interpretation per page."""
+
+    def __init__(
+        self,
+        rsrcmgr: PDFResourceManager,
+        *receivers: PDFLayoutAnalyzer,
+        pageno: int = 1,
+        laparams: Optional[LAParams] = None
+    ):
+        PDFLayoutAnalyzer.__init__(self, rsrcmgr, pageno=pageno, laparams=laparams)
+        self.receivers: List[PDFLayoutAnalyzer] = list(receivers)
+
+    def receive_layout(self, ltpage: LTPage) -> None:
+        for receiver in self.receivers:
+            receiver.receive_layout(ltpage)
+
+    def close(self) -> None:
+        for receiver in self.receivers:
+            receiver.close()
+
+
+class LeanPageDevice(PDFLayoutAnalyzer):
+    """A device which records glyphs into arrays instead of building LTChar objects.
+
+    The bounding box, text, fontname and size of every glyph are computed as
+    LTChar computes them, but are appended to flat arrays rather than kept
+    as one object per glyph. When the page ends, the glyphs are grouped into
+    lines and textboxes over those arrays and the result is a CompactPage.
+    Rectangles, curves, images and figures, including any text within
+    figures, are collected and analyzed as usual."""
+
+    def __init__(
+        self,
+        rsrcmgr: PDFResourceManager,
+        pageno: int = 1,
+        laparams: Optional[LAParams] = None
+    ):
+        PDFLayoutAnalyzer.__init__(self, rsrcmgr, pageno=pageno, laparams=laparams)
+        self.result: Optional[CompactPage] = None
+        self._reset()
+
+    def begin_page(self, page: PDFPage, ctm: Matrix) -> None:
+        PDFLayoutAnalyzer.begin_page(self, page, ctm)
+        self._reset()
+
+    def end_page(self, page: PDFPage) -> None:
+        # Only figures hold characters of their own
+        if self.laparams is not None:
+            for item in self.cur_item:
+                item.analyze(self.laparams)
+        self.pageno += 1
+        self.result = CompactPage.from_glyphs(
+            self.cur_item,
+            np.frombuffer(self._bboxes, dtype=np.float64).reshape(-1, 4),
+            np.frombuffer(self._sizes, dtype=np.float64),
+            self._fontnames,
+            self._texts,
+            self.laparams,
+        )
+
+    def render_char(
+        self,
+        matrix: Matrix,
+        font: PDFFont,
+        fontsize: float,
+        scaling: float,
+        rise: float,
+        cid: int,
+        ncs: PDFColorSpace,
+        graphicstate: PDFGraphicState,
+    ) -> float:
+        # Text within figures is grouped by the figure, so keep its characters
+        if not isinstance(self.cur_item, LTPage):
+            return PDFLayoutAnalyzer.render_char(
+                self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate
+            )
+
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = self.handle_undefined_char(font, cid)
+
+        # Compute the bounding box as LTChar does
+        adv = font.char_width(cid) * fontsize * scaling
+        if font.is_vertical():
+            (vx, vy) = font.char_disp(cid)
+            vx = fontsize * 0.5 if vx is None else vx * fontsize * 0.001
+            vy = (1000 - vy) * fontsize * 0.001
+            bbox = (-vx, vy + rise + adv, -vx + fontsize, vy + rise)
+        else:
+            descent = font.get_descent() * fontsize
+            bbox = (0, descent + rise, adv, descent + rise + fontsize)
+        (x0, y0, x1, y1) = apply_matrix_rect(matrix, bbox)
+        (x0, x1) = (min(x0, x1), max(x0, x1))
+        (y0, y1) = (min(y0, y1), max(y0, y1))
+
+        self._bboxes.extend((x0, y0, x1, y1))
+        self._sizes.append(x1 - x0 if font.is_vertical() else y1 - y0)
+        self._fontnames.append(font.fontname)
+        self._texts.append(text)
+        return adv
+
+    def get_result(self) -> Optional[CompactPage]:
+        return self.result
+
+    def _reset(self) -> None:
+        self._bboxes = array('d')
+        self._sizes = array('d')
+        self._fontnames: List[str] = []
+        self._texts: List[str] = []
@@ -0,0 +1,221 @@
+# src/parser/extractors/document.py
+
+# Standard Imports
+from contextlib import ExitStack
+from io import StringIO
+import itertools
+import os
+from typing import (
+    BinaryIO, Container, Dict, Iterable, Iterator, List, Optional, Sequence, Text, Tuple, Union
+)
+
+# Third-Party Imports
+import pandas as pd
+from pdfminer.converter import PDFLayoutAnalyzer, PDFPageAggregator, TextConverter
+from pdfminer.layout import LAParams, LTPage
+from pdfminer.pdfdocument import PDFDocument, PDFNoPageLabels
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import dict_value
+
+# Local Imports
+from .cache import LayoutCache
+from .devices import CompositeDevice
+from .sources import open_pdf
+from .tables import extract_table
+
+
+class Document:
+    """A PDF document which is parsed once and reused for text, layouts and tables.
+
+    The parser, document and resource manager are created when the document
+    is opened, so the cross-reference table, page tree and fonts are only
+    read once however many outputs are requested. Page layouts are kept in
+    memory once analyzed and, when a cache or cache directory is provided,
+    are also shared with other runs through the layout cache. Each page is
+    interpreted at most once, with its layout forwarded to every output
+    which needs it. The page tree is walked at most once, and its index is
+    kept in the layout cache, so any single page can be analyzed on its own.
+
+    Page numbers are zero-based, as they are for extract_pages()."""
+
+    def __init__(
+        self,
+        file: Union[BinaryIO, Text, os.PathLike],
+        cache: Optional[Union[LayoutCache, Text, os.PathLike]] = None,
+        **params
+    ):
+        # Memory-map paths and spool streams which cannot seek
+        self._resources = ExitStack()
+        self.file = self._resources.enter_context(open_pdf(file))
+
+        try:
+            # Accept the path to a cache directory in place of a cache
+            self.cache = LayoutCache(cache) if isinstance(cache, (Text, os.PathLike)) else cache
+            self.digest = LayoutCache.hash_document(self.file) if self.cache is not None else None
+
+            # Initialize parser, document and resource manager
+            self.parser = PDFParser(self.file)
+            self.document = PDFDocument(self.parser)
+            self.rsrcmgr = PDFResourceManager(caching=True)
+
+        # Close the file when it is not a valid document
+        except BaseException:
+            self._resources.close()
+            raise
+
+        # Initialize layout analysis parameters
+        self.laparams = LAParams(**params) if params else LAParams()
+
+        # Initialize page aggregator, composite device and interpreter
+        self._aggregator = PDFPageAggregator(self.rsrcmgr, laparams=self.laparams)
+        self._device = CompositeDevice(self.rsrcmgr, laparams=self.laparams)
+        self._interpreter = PDFPageInterpreter(self.rsrcmgr, self._device)
+        self._layouts: Dict[int, LTPage] = {}
+
+        # Pages are located through an index of their object ids
+        self._objids: Optional[List[int]] = None
+        self._pages: Dict[int, PDFPage] = {}
+        self._labels: Optional[List[Optional[Text]]] = None
+
+    def __enter__(self) -> 'Document':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying file when it was opened by the document."""
+        self._resources.close()
+
+    def pages(
+        self, page_numbers: Optional[Container[int]] = None, maxpages: int = 0
+    ) -> Iterator[LTPage]:
+        """Yield the layouts of the selected pages, analyzing each page at most once."""
+        for index, page in self._select_pages(page_numbers, maxpages):
+            yield self._layout(index, page)
+
+    def page(self, page_number: int) -> LTPage:
+        """Return the layout of a single page, interpreting no other page."""
+        if not 0 <= page_number < len(self._page_index()):
+            raise IndexError(f"page {page_number} is out of range")
+        return self._layout(page_number, self._page(page_number))
+
+    def text(self, page_numbers: Optional[Container[int]] = None, maxpages: int = 0) -> str:
+        """Return the text of the selected pages, as extract_text() would."""
+        with StringIO() as output:
+            # Render text from the same layouts used for pages and tables
+            converter = TextConverter(self.rsrcmgr, output, laparams=self.laparams)
+            for index, page in self._select_pages(page_numbers, maxpages):
+                self._layout(index, page, receivers=[converter])
+            return output.getvalue()
+
+    def tables(
+        self,
+        page_numbers: Optional[Container[int]] = None,
+        maxpages: int = 0,
+        headers: int = 1
+    ) -> pd.DataFrame:
+        """Return the tabulated data on the selected pages, as extract_table() would."""
+        return extract_table(self.pages(page_numbers, maxpages), headers=headers)
+
+    def _layout(
+        self, index: int, page: PDFPage, receivers: Sequence[PDFLayoutAnalyzer] = ()
+    ) -> LTPage:
+        """Return the layout of a page, also passing it to any other receivers.
+
+        The page is only interpreted when its layout has not been analyzed."""
+        layout = self._layouts.get(index)
+
+        # Skip interpretation when the layout has been analyzed by a previous run
+        key = (
+            LayoutCache.make_key(self.digest, index, self.laparams)
+            if self.cache is not None
+            else None
+        )
+        if layout is None and key is not None:
+            layout = self.cache.get(key)
+
+        if layout is None:
+            # Number the layout by its position in the document
+            self._device.receivers = [self._aggregator, *receivers]
+            self._device.pageno = index + 1
+            self._interpreter.process_page(page)
+            layout = self._aggregator.get_result()
+
+            if key is not None:
+                self.cache.put(key, layout)
+
+        else:
+            for receiver in receivers:
+                receiver.receive_layout(layout)
+
+        self._layouts[index] = layout
+        return layout
+
+    def _select_pages(
+        self, page_numbers: Optional[Container[int]] = None, maxpages: int = 0
+    ) -> Iterator[Tuple[int, PDFPage]]:
+        """Select pages and their indexes without interpreting them."""
+        # Collect the page numbers once, so generators are not used up
+        if isinstance(page_numbers, Iterable):
+            page_numbers = frozenset(page_numbers)
+        selected = [
+            index for index in range(len(self._page_index()))
+            if page_numbers is None or index in page_numbers
+        ]
+        for index in selected[:maxpages] if maxpages else selected:
+            yield index, self._page(index)
+
+    def _page_index(self) -> List[int]:
+        """Return the object ids of every page, walking the page tree only when they are not cached."""
+        if self._objids is None:
+            if self.cache is not None:
+                self._objids = self.cache.get_page_index(self.digest)
+
+            if self._objids is None:
+                self._pages = dict(enumerate(PDFPage.create_pages(self.document)))
+                self._objids = [page.pageid for page in self._pages.values()]
+
+                if self.cache is not None:
+                    self.cache.put_page_index(self.digest, self._objids)
+
+        return self._objids
+
+    def _page(self, index: int) -> PDFPage:
+        """Return a page by its index, resolving only the objects of that page."""
+        if index not in self._pages:
+            objid = self._page_index()[index]
+            attrs = dict_value(self.document.getobj(objid)).copy()
+
+            # Inherit attributes from the ancestors of the page, as PDFPage.create_pages() does
+            visited = {objid}
+            ancestors = []
+            parent = attrs.get('Parent')
+            while parent is not None and getattr(parent, 'objid', None) not in visited:
+                visited.add(getattr(parent, 'objid', None))
+                ancestors.append(dict_value(parent))
+                parent = ancestors[-1].get('Parent')
+            ancestors.append(self.document.catalog)
+
+            for ancestor in ancestors:
+                for key, value in ancestor.items():
+                    if key in PDFPage.INHERITABLE_ATTRS and key not in attrs:
+                        attrs[key] = value
+
+            self._pages[index] = PDFPage(self.document, objid, attrs, self._page_label(index))
+
+        return self._pages[index]
+
+    def _page_label(self, index: int) -> Optional[Text]:
+        """Return the label of a page, or None when the document has no page labels."""
+        # Build the labels of every page once, as the page labels are walked from the first page
+        if self._labels is None:
+            try:
+                labels = self.document.get_page_labels()
+                self._labels = list(itertools.islice(labels, len(self._page_index())))
+            except PDFNoPageLabels:
+                self._labels = []
+
+        return self._labels[index] if index < len(self._labels) else None
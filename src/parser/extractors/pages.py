@@ -1,7 +1,14 @@
 # src/parser/extractors/pages.py
 
 # Standard Imports
-from typing import BinaryIO, Iterator, Text, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import itertools
+import os
+from typing import (
+    BinaryIO, Container, Dict, Iterable, Iterator, List, Optional, Text, Tuple, Union
+)
 
 # Third-Party Imports
 from pdfminer.converter import PDFPageAggregator
@@ -11,13 +18,161 @@ from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
 from pdfminer.pdfpage import PDFPage
 from pdfminer.pdfparser import PDFParser
 
+# Local Imports
+from ..models.page import CompactPage
+from .cache import LayoutCache
+from .devices import LeanPageDevice
+from .sources import open_pdf, spool_pdf
 
-def extract_pages(file: Union[BinaryIO, Text], **params) -> Iterator[LTPage]:
+# Pages interpreted by a worker process per task
+PAGES_PER_TASK = 4
+
+
+def extract_pages(
+    file: Union[BinaryIO, Text, os.PathLike],
+    page_numbers: Optional[Container[int]] = None,
+    maxpages: int = 0,
+    workers: int = 1,
+    cache: Optional[Union[LayoutCache, Text, os.PathLike]] = None,
+    lean: bool = False,
+    **params
+) -> Iterator[Union[LTPage, CompactPage]]:
     """Extract pages from a PDF document using pdfminer.six.
 
     While we could just use pdfminer.high_level.extract_pages(),
     the more verbose solution provides the opportunity to
-    customize and extend the process later."""
+    customize and extend the process later.
+
+    Page numbers are zero-based; pages which are not selected, or which
+    exceed the maximum number of pages, are never interpreted.
+
+    When more than one worker is requested, the pages are divided into
+    small batches and interpreted in separate processes; the layouts are
+    still yielded in page order as soon as each batch is finished, and
+    only a few batches per worker are pending at once.
+
+    When a cache or cache directory is provided, layouts analyzed by a
+    previous run are loaded from disk instead of being interpreted.
+
+    Paths are memory-mapped rather than read into memory, while streams
+    which cannot seek are spooled to a temporary file first.
+
+    When lean is set, glyphs are recorded straight into arrays rather than
+    LTChar objects and each page is yielded as a CompactPage, which needs
+    far less memory for text-heavy pages. Horizontal text is grouped into
+    lines and textboxes, and textboxes are ordered, as pdfminer.six does.
+    Compact pages can be passed to the selectors and reducers, but tables
+    and the analyzers still need the full layout."""
+
+    # Accept the path to a cache directory in place of a cache
+    if isinstance(cache, (Text, os.PathLike)):
+        cache = LayoutCache(cache)
+
+    if workers > 1:
+        yield from _extract_pages_in_parallel(
+            file, workers, page_numbers, maxpages, cache, lean, **params
+        )
+        return
+
+    with open_pdf(file) as fp:
+        yield from _iterate_layouts(fp, page_numbers, maxpages, cache, lean, **params)
+
+
+def _extract_pages_in_parallel(
+    file: Union[BinaryIO, Text, os.PathLike],
+    workers: int,
+    page_numbers: Optional[Container[int]] = None,
+    maxpages: int = 0,
+    cache: Optional[LayoutCache] = None,
+    lean: bool = False,
+    **params
+) -> Iterator[Union[LTPage, CompactPage]]:
+    """Extract pages from a PDF document using a pool of processes.
+
+    This function is designed to help extract pages
+    and should not be imported into other modules."""
+
+    # Worker processes cannot share an open file, so send them the path
+    # to the document, spooling streams to a temporary file first
+    with ExitStack() as stack:
+        if isinstance(file, (Text, os.PathLike)):
+            source = os.fspath(file)
+        else:
+            source = spool_pdf(file)
+            stack.callback(os.remove, source)
+
+        with open_pdf(source) as fp:
+            page_count = _count_pages(fp)
+
+        # Determine which pages will be interpreted
+        if isinstance(page_numbers, Iterable):
+            page_numbers = frozenset(page_numbers)
+        selected = [
+            index for index in range(page_count)
+            if page_numbers is None or index in page_numbers
+        ]
+        selected = selected[:maxpages] if maxpages else selected
+
+        # Divide the selected pages into small batches, so the first pages
+        # are yielded early and finished pages are not held back
+        batches = iter([
+            selected[start:start + PAGES_PER_TASK]
+            for start in range(0, len(selected), PAGES_PER_TASK)
+        ])
+
+        # Each worker opens its own parser and document, while only a few
+        # batches are pending at once and their results are yielded in order
+        executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        pending = deque(
+            executor.submit(_extract_page_range, source, batch, cache, lean, params)
+            for batch in itertools.islice(batches, workers * 2)
+        )
+        try:
+            while pending:
+                layouts = pending.popleft().result()
+                if (batch := next(batches, None)) is not None:
+                    pending.append(executor.submit(_extract_page_range, source, batch, cache, lean, params))
+                yield from layouts
+
+        # Drop the batches which have not started when extraction stops early
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _extract_page_range(
+    source: Text,
+    page_numbers: List[int],
+    cache: Optional[LayoutCache],
+    lean: bool,
+    params: Dict,
+) -> List[Union[LTPage, CompactPage]]:
+    """Extract a batch of pages from a PDF document.
+
+    This function is run inside a worker process to help extract pages
+    in parallel and should not be imported into other modules."""
+
+    with open_pdf(source) as file:
+        return list(
+            _iterate_layouts(file, frozenset(page_numbers), 0, cache, lean, **params)
+        )
+
+
+def _iterate_layouts(
+    file: BinaryIO,
+    page_numbers: Optional[Container[int]] = None,
+    maxpages: int = 0,
+    cache: Optional[LayoutCache] = None,
+    lean: bool = False,
+    **params
+) -> Iterator[Union[LTPage, CompactPage]]:
+    """Interpret the selected pages of a PDF document.
+
+    This function is designed to help extract pages
+    and should not be imported into other modules."""
+
+    # Hash the document before parsing so cached layouts can be found
+    digest = LayoutCache.hash_document(file) if cache is not None else None
 
     # Initialize parser, document and resource manager
     parser = PDFParser(file)
@@ -27,12 +182,71 @@ def extract_pages(file: Union[BinaryIO, Text], **params) -> Iterator[LTPage]:
     # Initialize layout analysis parameters
     laparams = LAParams(**params) if params else LAParams()
 
-    # Initialize page aggregator and interpreter
-    device = PDFPageAggregator(rsrcmgr, laparams=laparams)
+    # Initialize page aggregator, or lean device, and interpreter
+    device = (
+        LeanPageDevice(rsrcmgr, laparams=laparams)
+        if lean
+        else PDFPageAggregator(rsrcmgr, laparams=laparams)
+    )
     interpreter = PDFPageInterpreter(rsrcmgr, device)
 
     # Process page layouts
-    for page in PDFPage.create_pages(document):
+    for index, page in _select_pages(document, page_numbers, maxpages):
+        # Skip interpretation when the layout has already been analyzed
+        if cache is not None:
+            key = LayoutCache.make_key(digest, index, laparams, 'compact' if lean else '')
+            if (layout := cache.get(key)) is not None:
+                yield layout
+                continue
+
+        # Number the layout by its position in the document
+        device.pageno = index + 1
         interpreter.process_page(page)
         layout = device.get_result()
+
+        if cache is not None:
+            cache.put(key, layout)
+
         yield layout
+
+
+def _select_pages(
+    document: PDFDocument,
+    page_numbers: Optional[Container[int]] = None,
+    maxpages: int = 0,
+) -> Iterator[Tuple[int, PDFPage]]:
+    """Select pages and their indexes without interpreting them.
+
+    This function is designed to help extract pages and text
+    and should not be imported outside of the extractors."""
+
+    # Collect the page numbers once, so generators are not used up and lookups are fast
+    if isinstance(page_numbers, Iterable):
+        page_numbers = frozenset(page_numbers)
+
+    # Stop walking the page tree once the last selected page is reached
+    last_page = (
+        max(page_numbers, default=-1)
+        if isinstance(page_numbers, frozenset)
+        else None
+    )
+
+    selected = 0
+    for index, page in enumerate(PDFPage.create_pages(document)):
+        if last_page is not None and index > last_page:
+            break
+        if page_numbers is not None and index not in page_numbers:
+            continue
+        yield index, page
+        selected += 1
+        if maxpages and selected >= maxpages:
+            break
+
+
+def _count_pages(file: BinaryIO) -> int:
+    """Count the pages in a PDF document without interpreting them.
+
+    This function is designed to help extract pages
+    and should not be imported into other modules."""
+    document = PDFDocument(PDFParser(file))
+    return sum(1 for _ in PDFPage.create_pages(document))
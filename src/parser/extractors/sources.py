@@ -0,0 +1,69 @@
+# src/parser/extractors/sources.py
+
+# Standard Imports
+from contextlib import contextmanager
+import mmap
+import os
+import shutil
+from tempfile import NamedTemporaryFile, SpooledTemporaryFile
+from typing import BinaryIO, Iterator, Text, Union
+
+# Streams smaller than this are spooled in memory, larger ones on disk
+SPOOL_SIZE = 32 * 1024 * 1024
+
+
+@contextmanager
+def open_pdf(
+    file: Union[BinaryIO, Text, os.PathLike], spool_size: int = SPOOL_SIZE
+) -> Iterator[BinaryIO]:
+    """Open a PDF document for random access by pdfminer.six.
+
+    Paths are memory-mapped, so pages are read straight from the file
+    without copying it onto the heap. Streams which cannot seek, such as
+    network or object-store responses, are first copied to a temporary
+    file which only stays in memory while it is smaller than the spool
+    size. Seekable files are used as they are. Only files opened here
+    are closed when the context exits."""
+
+    if isinstance(file, (Text, os.PathLike)):
+        with open(file, 'rb') as fp:
+            # Empty files cannot be mapped, so let the parser report them
+            if os.fstat(fp.fileno()).st_size == 0:
+                yield fp
+                return
+
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    elif _is_seekable(file):
+        yield file
+
+    else:
+        with SpooledTemporaryFile(max_size=spool_size) as spooled:
+            shutil.copyfileobj(file, spooled)
+            spooled.seek(0)
+            yield spooled
+
+
+def spool_pdf(file: BinaryIO) -> Text:
+    """Copy a PDF document from a stream to a temporary file and return its path.
+
+    The whole stream is copied, from its start when it can seek, so that
+    other processes can open the document by its path. The caller must
+    remove the file once it is no longer needed."""
+    with NamedTemporaryFile(suffix='.pdf', delete=False) as spooled:
+        if _is_seekable(file):
+            file.seek(0)
+        shutil.copyfileobj(file, spooled)
+    return spooled.name
+
+
+def _is_seekable(file: BinaryIO) -> bool:
+    """Return whether a file supports random access.
+
+    This function is designed to help open PDF documents
+    and should not be imported into other modules."""
+    try:
+        return file.seekable()
+    except (AttributeError, ValueError):
+        return False
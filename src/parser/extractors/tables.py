@@ -1,30 +1,35 @@
 # src/parser/extractors/tables.py
 
 # Standard Imports
-from functools import reduce
-from typing import Dict, Iterable, List, Text, Tuple, Union
+from bisect import bisect_left, bisect_right
+from typing import Callable, Dict, Iterable, Iterator, List, Text, Tuple, Union
 
 # Third-Party Imports
 import pandas as pd
 from pdfminer.layout import LTPage, LTContainer
 
 # Local Imports
-from .. import callbacks as cb
+from ..analyzers.context import AnalysisContext
 from ..analyzers.divisions import determine_column_positions, determine_row_positions
 from ..analyzers.sections import determine_header_positions
+from ..models.page import CompactPage
 from ..selectors import select_lines
+from ..utils.spatial import SpatialIndex
 
 
 def extract_table(container: Union[LTPage, Iterable[LTPage]], headers: int = 1) -> pd.DataFrame:
     """Extract tabulated data from PDF page(s)."""
 
+    # Compact pages do not hold the layout objects tables are analyzed from
+    if isinstance(container, CompactPage):
+        raise TypeError("a CompactPage is not a valid argument type, extract the pages without lean")
+
     # Ensure argument is an LTPage object
     if isinstance(container, LTPage):
         table = _extract_table_from_page(container, headers)
 
     elif isinstance(container, Iterable):
-        dataframes = [extract_table(page, headers=headers) for page in container if isinstance(page, LTPage)]
-        table = pd.concat(dataframes, ignore_index=True)
+        table = pd.concat(iter_tables(container, headers=headers), ignore_index=True)
 
     # otherwise return an empty list
     else:
@@ -33,6 +38,28 @@ def extract_table(container: Union[LTPage, Iterable[LTPage]], headers: int = 1)
     return table
 
 
+def iter_tables(container: Union[LTPage, Iterable[LTPage]], headers: int = 1) -> Iterator[pd.DataFrame]:
+    """Yield the tabulated data from each PDF page as soon as it is extracted.
+
+    Pages are consumed one at a time, so passing the generator returned by
+    extract_pages() keeps memory bounded to a single page."""
+
+    # Treat a single page as an iterable containing one page
+    if isinstance(container, (LTPage, CompactPage)):
+        container = [container]
+
+    elif not isinstance(container, Iterable):
+        raise TypeError(f"{type(container)!s} is not a valid argument type")
+
+    for page in container:
+        # Compact pages do not hold the layout objects tables are analyzed from
+        if isinstance(page, CompactPage):
+            raise TypeError("a CompactPage is not a valid argument type, extract the pages without lean")
+
+        if isinstance(page, LTPage):
+            yield _extract_table_from_page(page, headers)
+
+
 # TODO: Refactor to use determine header position function.
 def _extract_table_from_page(page: LTPage, headers: int = 1) -> pd.DataFrame:
     """Extract tabulated data from a PDF page.
@@ -40,22 +67,29 @@ def _extract_table_from_page(page: LTPage, headers: int = 1) -> pd.DataFrame:
     This function is designed to help extract tables
     and should not be imported into other modules."""
 
+    # Share one analysis context so no part of the page is analyzed twice
+    context = AnalysisContext()
+
     # Determine positions of rows and columns
-    rows = determine_row_positions(page)
-    cols = determine_column_positions(page)
+    rows = determine_row_positions(page, context=context)
+    cols = determine_column_positions(page, context=context)
 
     # Determine position of header
-    headers = determine_header_positions(page)
+    headers = determine_header_positions(page, context=context)
     num_header_rows = len(headers)
 
+    # Index the lines on the page once so each cell is a range query
+    index = SpatialIndex(select_lines(page))
+
     # Extract field names
-    fields = extract_field_names(page, rows, cols, num_header_rows)
+    fields = extract_field_names(index, rows, cols, num_header_rows)
 
     # Extract table entries
-    table_entries = []
-    for row in rows[num_header_rows:]:
-        table_entry = extract_table_entry(page, row, cols, fields)
-        table_entries.append(table_entry)
+    grid = extract_grid_content(index, rows[num_header_rows:], cols)
+    table_entries = [
+        {field: content for field, content in zip(fields, cells)}
+        for cells in grid
+    ]
 
     # Convert table entries into DataFrame
     table = pd.DataFrame(table_entries)
@@ -63,7 +97,7 @@ def _extract_table_from_page(page: LTPage, headers: int = 1) -> pd.DataFrame:
 
 
 # TODO: Refactor to make use of coordinates provided by determine_header_positions.
-def extract_field_names(container: LTContainer, rows: List, columns: List, header_rows: int = 1) -> pd.Index:
+def extract_field_names(container: Union[LTContainer, SpatialIndex], rows: List, columns: List, header_rows: int = 1) -> pd.Index:
     """Return the field names found inside the header rows."""
     # If there are no headers, assign each field a number
     if header_rows == 0:
@@ -82,7 +116,7 @@ def extract_field_names(container: LTContainer, rows: List, columns: List, heade
     return pd.Index(field_names)
 
 
-def extract_table_entry(container: LTContainer, row: Tuple, columns: List, field_names: List) -> Dict:
+def extract_table_entry(container: Union[LTContainer, SpatialIndex], row: Tuple, columns: List, field_names: List) -> Dict:
     """Return a dictionary containing each field and value from the row of a table."""
 
     # Extract row content and assign a field to each cell
@@ -92,7 +126,7 @@ def extract_table_entry(container: LTContainer, row: Tuple, columns: List, field
     return entry
 
 
-def extract_column_content(container: LTContainer, column: Tuple, rows: List) -> List:
+def extract_column_content(container: Union[LTContainer, SpatialIndex], column: Tuple, rows: List) -> List:
     """Return the content of LTTextLineHorizontal objects inside a table column."""
     # Select cells inside the table column and extract their content
     content = []
@@ -103,7 +137,7 @@ def extract_column_content(container: LTContainer, column: Tuple, rows: List) ->
     return content
 
 
-def extract_row_content(container: LTContainer, row: Tuple, columns: List) -> List:
+def extract_row_content(container: Union[LTContainer, SpatialIndex], row: Tuple, columns: List) -> List:
     """Return the content of LTTextLineHorizontal objects inside a table row."""
     # Select cells inside the table row and extract their content
     content = []
@@ -114,9 +148,74 @@ def extract_row_content(container: LTContainer, row: Tuple, columns: List) -> Li
     return content
 
 
-def extract_cell_content(container: LTContainer, bbox: Tuple) -> Text:
+def extract_grid_content(container: Union[LTContainer, SpatialIndex], rows: List, columns: List) -> List[List[Text]]:
+    """Return the content of LTTextLineHorizontal objects inside each cell of a table.
+
+    Each line is visited once and placed into its row and column by bisecting
+    the sorted boundaries, instead of searching the container once per cell.
+    Nested or overlapping boundaries which do not end in order are scanned instead."""
+    # Sort boundaries by their lower edges so they can be bisected
+    row_order = sorted(range(len(rows)), key=lambda idx: rows[idx][0])
+    col_order = sorted(range(len(columns)), key=lambda idx: columns[idx][0])
+    locate_rows = _slot_locator([rows[idx] for idx in row_order], margin=1)
+    locate_cols = _slot_locator([columns[idx] for idx in col_order], margin=1)
+
+    # Assign the text of each line to every cell it falls within
+    cells = [[[] for _ in columns] for _ in rows]
+    for line in select_lines(container):
+        for row_idx in locate_rows((line.y0, line.y1)):
+            for col_idx in locate_cols((line.x0, line.x1)):
+                cells[row_order[row_idx]][col_order[col_idx]].append(line.get_text())
+
+    # Combine the text within each cell
+    return [["".join(texts).strip() for texts in row] for row in cells]
+
+
+def extract_cell_content(container: Union[LTContainer, SpatialIndex], bbox: Tuple) -> Text:
     """Return the content of LTTextLineHorizontal objects inside a table cell."""
     # Select lines inside the table cell and combine their content
-    lines = select_lines(container, cb.within(bbox, margin=1))
-    content = reduce(lambda acc, ln: (acc + ln.get_text()), lines, "").strip()
+    if isinstance(container, SpatialIndex):
+        lines = container.within(bbox, margin=1)
+    else:
+        region = (bbox[0] - 1, bbox[1] - 1, bbox[2] + 1, bbox[3] + 1)
+        lines = select_lines(container, region=region)
+    content = "".join(ln.get_text() for ln in lines).strip()
     return content
+
+
+def _slot_locator(boundaries: List, margin: float = 0) -> Callable[[Tuple], Iterable[int]]:
+    """Return a function locating the indexes of the sorted boundaries which contain a span.
+
+    This function is designed to help extract tables
+    and should not be imported into other modules."""
+    lower_edges = [boundary[0] for boundary in boundaries]
+    upper_edges = [boundary[1] for boundary in boundaries]
+
+    # Check once whether the boundaries end in the same order as they start
+    if all(upper_edges[idx] <= upper_edges[idx + 1] for idx in range(len(upper_edges) - 1)):
+        return lambda span: _locate_slots(span, lower_edges, upper_edges, margin)
+
+    return lambda span: _scan_slots(span, lower_edges, upper_edges, margin)
+
+
+def _locate_slots(span: Tuple, lower_edges: List, upper_edges: List, margin: float = 0) -> range:
+    """Return the indexes of boundaries sorted by both edges which contain a span.
+
+    This function is designed to help extract tables
+    and should not be imported into other modules."""
+    # Boundaries containing the span start below it and end above it, and
+    # as both edges are sorted, they lie between two bisection points
+    start = bisect_left(upper_edges, span[1] - margin)
+    stop = bisect_right(lower_edges, span[0] + margin)
+    return range(start, stop)
+
+
+def _scan_slots(span: Tuple, lower_edges: List, upper_edges: List, margin: float = 0) -> List[int]:
+    """Return the indexes of boundaries sorted by their lower edges which contain a span.
+
+    This function is designed to help extract tables
+    and should not be imported into other modules."""
+    # Only boundaries starting below the span can enclose it, but nested or
+    # overlapping boundaries do not end in order, so check each of them
+    stop = bisect_right(lower_edges, span[0] + margin)
+    return [idx for idx in range(stop) if span[1] <= upper_edges[idx] + margin]
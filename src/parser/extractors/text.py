@@ -2,23 +2,52 @@
 
 # Standard Imports
 from io import StringIO
-from typing import BinaryIO, Text, Union
+import os
+from typing import BinaryIO, Container, Optional, Text, Union
 
 # Third-Party Imports
 from pdfminer.converter import TextConverter
 from pdfminer.layout import LAParams
 from pdfminer.pdfdocument import PDFDocument
 from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
-from pdfminer.pdfpage import PDFPage
 from pdfminer.pdfparser import PDFParser
 
+# Local Imports
+from .pages import _select_pages
+from .sources import open_pdf
 
-def extract_text(file: Union[BinaryIO, Text], **params) -> str:
+
+def extract_text(
+    file: Union[BinaryIO, Text, os.PathLike],
+    page_numbers: Optional[Container[int]] = None,
+    maxpages: int = 0,
+    **params
+) -> str:
     """Extract text from a PDF document using pdfminer.six.
 
     While we could just use pdfminer.high_level.extract_text(),
     the more verbose solution provides the opportunity to
-    customize and extend the process later."""
+    customize and extend the process later.
+
+    Page numbers are zero-based; pages which are not selected, or which
+    exceed the maximum number of pages, are never interpreted.
+
+    Paths are memory-mapped rather than read into memory, while streams
+    which cannot seek are spooled to a temporary file first."""
+    with open_pdf(file) as fp:
+        return _extract_text(fp, page_numbers, maxpages, **params)
+
+
+def _extract_text(
+    file: BinaryIO,
+    page_numbers: Optional[Container[int]] = None,
+    maxpages: int = 0,
+    **params
+) -> str:
+    """Extract text from an open PDF document.
+
+    This function is designed to help extract text
+    and should not be imported into other modules."""
 
     # Initialize parser, document and resource manager
     parser = PDFParser(file)
@@ -33,8 +62,8 @@ def extract_text(file: Union[BinaryIO, Text], **params) -> str:
         device = TextConverter(rsrcmgr, output, laparams=laparams)
         interpreter = PDFPageInterpreter(rsrcmgr, device)
 
-        # Process page text
-        for page in PDFPage.create_pages(document):
+        # Process page text, selecting pages as extract_pages() does
+        for _, page in _select_pages(document, page_numbers, maxpages):
             interpreter.process_page(page)
 
         return output.getvalue()
@@ -0,0 +1,430 @@
+# src/parser/models/page.py
+
+# Standard Imports
+from typing import Dict, List, Sequence, Tuple
+
+# Third-Party Imports
+import numpy as np
+from pdfminer.layout import (
+    IndexAssigner, LAParams, LTAnno, LTChar, LTContainer, LTCurve, LTFigure, LTImage,
+    LTItem, LTPage, LTRect, LTTextBox, LTTextBoxHorizontal, LTTextLine
+)
+
+# Local Imports
+from .. import callbacks as cb
+from .component import Component
+
+# Type codes assigned to each layout item
+TEXTBOX = 1
+TEXTLINE = 2
+CHARACTER = 3
+RECTANGLE = 4
+CURVE = 5
+FIGURE = 6
+IMAGE = 7
+OTHER = 0
+
+
+class CompactPage(Component):
+    """A columnar representation of the layout items on a page.
+
+    Each layout item occupies one row across a set of NumPy arrays holding
+    its bounding box, type code, parent, font and size, while the text of
+    every item is a slice of a single string buffer. Items appear in the
+    same depth-first order as the LTPage they were built from."""
+
+    def __init__(
+        self,
+        pageid: int,
+        bbox: Tuple,
+        bboxes: np.ndarray,
+        kinds: np.ndarray,
+        parents: np.ndarray,
+        font_ids: np.ndarray,
+        sizes: np.ndarray,
+        text_offsets: np.ndarray,
+        text: str,
+        fonts: List[str],
+    ):
+        Component.__init__(self, bbox)
+        self.pageid = pageid
+        self.bboxes = bboxes
+        self.kinds = kinds
+        self.parents = parents
+        self.font_ids = font_ids
+        self.sizes = sizes
+        self.text_offsets = text_offsets
+        self.text = text
+        self.fonts = fonts
+
+    def __len__(self):
+        return len(self.kinds)
+
+    @classmethod
+    def from_layout(cls, page: LTPage) -> 'CompactPage':
+        """Build a compact page from the layout of an LTPage."""
+        builder = _Builder()
+        for item in page:
+            builder.add(item, parent=-1)
+        return builder.build(page)
+
+    @classmethod
+    def from_glyphs(
+        cls,
+        page: LTPage,
+        bboxes: np.ndarray,
+        sizes: np.ndarray,
+        fontnames: Sequence[str],
+        texts: Sequence[str],
+        laparams: LAParams = None,
+    ) -> 'CompactPage':
+        """Build a compact page from glyphs recorded as arrays rather than LTChar objects.
+
+        Glyphs are grouped into lines and lines into textboxes with the rules
+        pdfminer.six applies to horizontal text, evaluated over the arrays.
+        Textboxes are ordered as pdfminer.six orders them, while any other items
+        on the page, such as rectangles and curves, are added after the textboxes."""
+        laparams = laparams or LAParams()
+        bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        builder = _Builder()
+
+        # Consecutive glyphs which are aligned horizontally form lines
+        starts = _line_starts(bboxes, laparams)
+        stops = np.append(starts[1:], len(bboxes)).astype(np.int64)
+        spaces = _word_breaks(bboxes, starts, laparams)
+        lines, empties = [], []
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            # Lines holding only whitespace are left out of textboxes
+            spans = empties if "".join(texts[start:stop]).isspace() else lines
+            spans.append((start, stop))
+
+        # Neighbouring lines which are aligned vertically form textboxes
+        line_bboxes = _span_bboxes(bboxes, lines)
+        labels = _box_labels(line_bboxes, laparams)
+        boxes = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+        box_bboxes = np.array([
+            (*line_bboxes[members, :2].min(axis=0), *line_bboxes[members, 2:].max(axis=0))
+            for members in boxes
+        ]).reshape(-1, 4)
+
+        def add_line(line: Tuple[int, int], bbox: Tuple, parent: int) -> None:
+            index = builder.open(bbox, TEXTLINE, parent)
+            for glyph in range(*line):
+                if spaces[glyph]:
+                    builder.append_text(' ')
+                char = builder.open(
+                    bboxes[glyph], CHARACTER, index, fontname=fontnames[glyph], size=sizes[glyph]
+                )
+                builder.append_text(texts[glyph])
+                builder.close(char)
+            builder.append_text('\n')
+            builder.close(index)
+
+        for box in _box_order(page, box_bboxes, laparams):
+            index = builder.open(box_bboxes[box], TEXTBOX, -1)
+            for member in sorted(boxes[box], key=lambda idx: -line_bboxes[idx, 3]):
+                add_line(lines[member], line_bboxes[member], index)
+            builder.close(index)
+
+        for item in page:
+            builder.add(item, parent=-1)
+
+        for line, bbox in zip(empties, _span_bboxes(bboxes, empties)):
+            add_line(line, bbox, -1)
+
+        return builder.build(page)
+
+    def select(
+        self, kind: int, boundary: Tuple = None, margin: float = 0, parent_kind: int = None
+    ) -> np.ndarray:
+        """Return the indexes of items of a kind, optionally within a boundary.
+
+        Passing a parent kind only selects items directly inside items of that
+        kind, such as the lines inside textboxes that select_lines() returns."""
+        mask = self.kinds == kind
+        if parent_kind is not None:
+            parent_kinds = np.where(self.parents >= 0, self.kinds[self.parents], OTHER)
+            mask &= (self.parents >= 0) & (parent_kinds == parent_kind)
+        if boundary:
+            mask &= cb.mask(self.bboxes, cb.within(boundary, margin))
+        return np.flatnonzero(mask)
+
+    def children(self, index: int) -> np.ndarray:
+        """Return the indexes of the items directly inside an item."""
+        return np.flatnonzero(self.parents == index)
+
+    def get_text(self, index: int) -> str:
+        """Return the text of an item, as LTTextContainer.get_text() would."""
+        start, end = self.text_offsets[index]
+        return self.text[start:end]
+
+    def positions(self, indexes: Sequence[int]) -> List[Tuple]:
+        """Return the positions of items, rounded as abstractors.get_position() does."""
+        return [tuple(bbox) for bbox in np.round(self.bboxes[indexes], 3).tolist()]
+
+    def fontnames(self, indexes: Sequence[int]) -> List[str]:
+        """Return the raw fontnames of characters."""
+        return [self.fonts[font_id] for font_id in self.font_ids[indexes] if font_id >= 0]
+
+    def fontsizes(self, indexes: Sequence[int]) -> List[float]:
+        """Return the fontsizes of characters."""
+        sizes = self.sizes[indexes]
+        return sizes[~np.isnan(sizes)].tolist()
+
+
+class _Builder:
+    """Accumulate layout items before converting them into arrays.
+
+    This class is designed to help build compact pages
+    and should not be imported into other modules."""
+
+    def __init__(self):
+        self.bboxes = []
+        self.kinds = []
+        self.parents = []
+        self.font_ids = []
+        self.sizes = []
+        self.text_offsets = []
+        self.buffer = []
+        self.length = 0
+        self.fonts: Dict[str, int] = {}
+
+    def add(self, item: LTItem, parent: int) -> None:
+        # Whitespace inserted by layout analysis has no position,
+        # but contributes to the text of its container
+        if isinstance(item, LTAnno):
+            self.append_text(item.get_text())
+            return
+
+        if isinstance(item, LTChar):
+            index = self.open(item.bbox, CHARACTER, parent, fontname=item.fontname, size=item.size)
+            self.append_text(item.get_text())
+        else:
+            index = self.open(item.bbox, _kind(item), parent)
+
+        if isinstance(item, LTContainer):
+            for child in item:
+                self.add(child, parent=index)
+
+        self.close(index)
+
+    def open(
+        self, bbox: Sequence[float], kind: int, parent: int, fontname: str = None, size: float = np.nan
+    ) -> int:
+        """Add an item whose text begins at the end of the buffer, returning its index."""
+        index = len(self.kinds)
+        self.bboxes.append(tuple(bbox))
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.text_offsets.append([self.length, self.length])
+        self.font_ids.append(
+            self.fonts.setdefault(fontname, len(self.fonts)) if fontname is not None else -1
+        )
+        self.sizes.append(size)
+        return index
+
+    def close(self, index: int) -> None:
+        """End the text of an item at the end of the buffer."""
+        self.text_offsets[index][1] = self.length
+
+    def build(self, page: LTPage) -> CompactPage:
+        return CompactPage(
+            pageid=page.pageid,
+            bbox=page.bbox,
+            bboxes=np.array(self.bboxes, dtype=np.float64).reshape(-1, 4),
+            kinds=np.array(self.kinds, dtype=np.int8),
+            parents=np.array(self.parents, dtype=np.int32),
+            font_ids=np.array(self.font_ids, dtype=np.int32),
+            sizes=np.array(self.sizes, dtype=np.float64),
+            text_offsets=np.array(self.text_offsets, dtype=np.int64).reshape(-1, 2),
+            text="".join(self.buffer),
+            fonts=list(self.fonts),
+        )
+
+    def append_text(self, text: str) -> None:
+        self.buffer.append(text)
+        self.length += len(text)
+
+
+def _kind(item: LTItem) -> int:
+    """Return the type code of a layout item.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    if isinstance(item, LTTextBox):
+        return TEXTBOX
+    elif isinstance(item, LTTextLine):
+        return TEXTLINE
+    elif isinstance(item, LTChar):
+        return CHARACTER
+    elif isinstance(item, LTRect):
+        return RECTANGLE
+    elif isinstance(item, LTCurve):
+        return CURVE
+    elif isinstance(item, LTFigure):
+        return FIGURE
+    elif isinstance(item, LTImage):
+        return IMAGE
+    else:
+        return OTHER
+
+
+def _line_starts(bboxes: np.ndarray, laparams: LAParams) -> np.ndarray:
+    """Return the index of the first glyph of each line.
+
+    Like LTLayoutContainer.group_objects(), consecutive glyphs belong to the
+    same line when they overlap vertically by enough of their height and are
+    separated horizontally by less than the character margin.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    if not len(bboxes):
+        return np.zeros(0, dtype=np.int64)
+
+    prev, curr = bboxes[:-1], bboxes[1:]
+    widths, heights = bboxes[:, 2] - bboxes[:, 0], bboxes[:, 3] - bboxes[:, 1]
+
+    # Vertical overlap and horizontal distance, as LTComponent measures them
+    is_voverlap = (curr[:, 1] <= prev[:, 3]) & (prev[:, 1] <= curr[:, 3])
+    voverlap = np.where(
+        is_voverlap,
+        np.minimum(np.abs(prev[:, 1] - curr[:, 3]), np.abs(prev[:, 3] - curr[:, 1])),
+        0
+    )
+    is_hoverlap = (curr[:, 0] <= prev[:, 2]) & (prev[:, 0] <= curr[:, 2])
+    hdistance = np.where(
+        is_hoverlap,
+        0,
+        np.minimum(np.abs(prev[:, 0] - curr[:, 2]), np.abs(prev[:, 2] - curr[:, 0]))
+    )
+
+    aligned = (
+        is_voverlap
+        & (np.minimum(heights[:-1], heights[1:]) * laparams.line_overlap < voverlap)
+        & (hdistance < np.maximum(widths[:-1], widths[1:]) * laparams.char_margin)
+    )
+    return np.flatnonzero(np.concatenate(([True], ~aligned)))
+
+
+def _word_breaks(bboxes: np.ndarray, starts: np.ndarray, laparams: LAParams) -> np.ndarray:
+    """Return whether a space precedes each glyph.
+
+    Like LTTextLineHorizontal.add(), a space is inserted when the gap from the
+    previous glyph of the line exceeds the word margin.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    spaces = np.zeros(len(bboxes), dtype=bool)
+    if len(bboxes) > 1:
+        margins = laparams.word_margin * np.maximum(
+            bboxes[1:, 2] - bboxes[1:, 0], bboxes[1:, 3] - bboxes[1:, 1]
+        )
+        spaces[1:] = bboxes[:-1, 2] < bboxes[1:, 0] - margins
+    spaces[starts] = False
+    return spaces
+
+
+def _span_bboxes(bboxes: np.ndarray, spans: Sequence[Tuple[int, int]]) -> np.ndarray:
+    """Return the bounding box of each contiguous span of glyphs.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    return np.array([
+        (*bboxes[start:stop, :2].min(axis=0), *bboxes[start:stop, 2:].max(axis=0))
+        for start, stop in spans
+    ]).reshape(-1, 4)
+
+
+def _box_labels(lines: np.ndarray, laparams: LAParams) -> np.ndarray:
+    """Return the textbox each line belongs to.
+
+    Like LTLayoutContainer.group_textlines(), lines are neighbours when they
+    lie within the line margin of each other, share a height and are aligned
+    on the left, right or centre; neighbouring lines share a textbox.
+    Neighbours are found among lines sorted by height on the page, and
+    joined into textboxes with a union-find, so dense pages never compare
+    every pair of lines.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    count = len(lines)
+    if not count:
+        return np.zeros(0, dtype=np.int64)
+
+    x0, y0, x1, y1 = (lines[:, idx] for idx in range(4))
+    heights = y1 - y0
+    margins = laparams.line_margin * heights
+
+    # Lines sorted by their bottom edge, so each line only meets the few
+    # lines whose bottom lies within reach of its own margins
+    order = np.argsort(y0, kind='stable')
+    bottoms = y0[order]
+    lowest = np.searchsorted(bottoms, y0 - margins - heights.max(), side='left')
+    highest = np.searchsorted(bottoms, y1 + margins, side='left')
+
+    parents = list(range(count))
+    for line in range(count):
+        candidates = order[lowest[line]:highest[line]]
+        tolerance = margins[line]
+        neighbours = candidates[
+            (x0[candidates] < x1[line]) & (x0[line] < x1[candidates])
+            & (y0[candidates] < y1[line] + tolerance) & (y0[line] - tolerance < y1[candidates])
+            & (np.abs(heights[candidates] - heights[line]) <= tolerance)
+            & (
+                (np.abs(x0[candidates] - x0[line]) <= tolerance)
+                | (np.abs(x1[candidates] - x1[line]) <= tolerance)
+                | (np.abs((x0[candidates] + x1[candidates]) / 2 - (x0[line] + x1[line]) / 2) <= tolerance)
+            )
+        ]
+        for neighbour in neighbours.tolist():
+            _union(parents, line, neighbour)
+
+    # Label each line with the lowest index in its textbox
+    return np.array([_find(parents, line) for line in range(count)], dtype=np.int64)
+
+
+def _find(parents: List[int], item: int) -> int:
+    """Return the representative of an item's set, halving the path to it.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    while parents[item] != item:
+        parents[item] = parents[parents[item]]
+        item = parents[item]
+    return item
+
+
+def _union(parents: List[int], first: int, second: int) -> None:
+    """Join the sets of two items, keeping the lowest index as their representative.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    first, second = _find(parents, first), _find(parents, second)
+    if first != second:
+        parents[max(first, second)] = min(first, second)
+
+
+def _box_order(page: LTPage, bboxes: np.ndarray, laparams: LAParams) -> List[int]:
+    """Return the indexes of textboxes in reading order.
+
+    Textboxes are sorted from top to bottom and left to right when boxes_flow
+    is None. Otherwise they are grouped hierarchically by pdfminer.six itself,
+    using one empty textbox in place of each textbox, which is cheap since
+    pages hold far fewer textboxes than characters.
+
+    This function is designed to help build compact pages
+    and should not be imported into other modules."""
+    if laparams.boxes_flow is None:
+        return sorted(range(len(bboxes)), key=lambda idx: (-bboxes[idx, 1], bboxes[idx, 0]))
+
+    boxes = []
+    for bbox in bboxes.tolist():
+        box = LTTextBoxHorizontal()
+        box.set_bbox(tuple(bbox))
+        boxes.append(box)
+
+    assigner = IndexAssigner()
+    for group in page.group_textboxes(laparams, boxes):
+        group.analyze(laparams)
+        assigner.run(group)
+    return sorted(range(len(boxes)), key=lambda idx: boxes[idx].index)
@@ -8,7 +8,9 @@ from typing import Callable, Dict, Iterable, List, Set, Text, Union
 from pdfminer.layout import LTItem
 
 # Local Imports
-from ..abstractors import get_fontname, get_fontsize, get_fontweight, get_typeface
+from .. import callbacks as cb
+from ..abstractors import get_fontname, get_fontsize, get_fontweight, get_typeface, parse_fontname
+from ..models.page import CompactPage
 from ..selectors import select_characters
 
 
@@ -20,15 +22,22 @@ def reduce_fontnames(
     """
     Return all font names used in a container.
     :param accumulator: an instance of dict, list or set.
-    :param container: an instance of an LTItem object or an iterable containing them.
-    :param callbacks: functions to filter the LTChar items.
+    :param container: an instance of an LTItem object, a CompactPage or an iterable containing them.
+    :param callbacks: functions to filter the LTChar items, which must be positional for a CompactPage.
     """
+    # The characters of a compact page are read from its arrays
+    if isinstance(container, CompactPage):
+        characters = select_characters(container, *callbacks)
+        fontnames = [parse_fontname(fontname)[0] for fontname in container.fontnames(characters)]
+        return _accumulate(accumulator, fontnames)
+
+    predicate = cb.compose(*callbacks)
     characters = select_characters(container)
 
     # extract fontnames from instances of LTChar
     fontnames = [
         get_fontname(char) for char in characters
-        if all(map(lambda cb: cb(char), callbacks))
+        if predicate(char)
     ]
 
     # return accumulated values
@@ -43,15 +52,21 @@ def reduce_fontsizes(
     """
     Return all font sizes used in a container.
     :param accumulator: an instance of dict, list or set.
-    :param container: an instance of an LTItem object or an iterable containing them.
-    :param callbacks: functions to filter the LTChar items.
+    :param container: an instance of an LTItem object, a CompactPage or an iterable containing them.
+    :param callbacks: functions to filter the LTChar items, which must be positional for a CompactPage.
     """
+    # The characters of a compact page are read from its arrays
+    if isinstance(container, CompactPage):
+        characters = select_characters(container, *callbacks)
+        return _accumulate(accumulator, container.fontsizes(characters))
+
+    predicate = cb.compose(*callbacks)
     characters = select_characters(container)
 
     # extract fontsizes from instances of LTChar
     fontsizes = [
         get_fontsize(char) for char in characters
-        if all(map(lambda cb: cb(char), callbacks))
+        if predicate(char)
     ]
 
     # return accumulated values
@@ -66,15 +81,22 @@ def reduce_fontweights(
     """
     Return all font names used in a container.
     :param accumulator: an instance of dict, list or set.
-    :param container: an instance of an LTItem object or an iterable containing them.
-    :param callbacks: functions to filter the LTChar items.
+    :param container: an instance of an LTItem object, a CompactPage or an iterable containing them.
+    :param callbacks: functions to filter the LTChar items, which must be positional for a CompactPage.
     """
+    # The characters of a compact page are read from its arrays
+    if isinstance(container, CompactPage):
+        characters = select_characters(container, *callbacks)
+        fontweights = [parse_fontname(fontname)[2] for fontname in container.fontnames(characters)]
+        return _accumulate(accumulator, fontweights)
+
+    predicate = cb.compose(*callbacks)
     characters = select_characters(container)
 
     # extract fontweights from instances of LTChar
     fontweights = [
         get_fontweight(char) for char in characters
-        if all(map(lambda cb: cb(char), callbacks))
+        if predicate(char)
     ]
 
     # return accumulated values
@@ -89,15 +111,22 @@ def reduce_typefaces(
     """
     Return all typefaces used in a container.
     :param accumulator: an instance of dict, list or set.
-    :param container: an instance of an LTItem object or an iterable containing them.
-    :param callbacks: functions to filter the LTChar items.
+    :param container: an instance of an LTItem object, a CompactPage or an iterable containing them.
+    :param callbacks: functions to filter the LTChar items, which must be positional for a CompactPage.
     """
+    # The characters of a compact page are read from its arrays
+    if isinstance(container, CompactPage):
+        characters = select_characters(container, *callbacks)
+        typefaces = [parse_fontname(fontname)[1] for fontname in container.fontnames(characters)]
+        return _accumulate(accumulator, typefaces)
+
+    predicate = cb.compose(*callbacks)
     characters = select_characters(container)
 
     # extract typefaces from instances of LTChar
     typefaces = [
         get_typeface(char) for char in characters
-        if all(map(lambda cb: cb(char), callbacks))
+        if predicate(char)
     ]
 
     # return accumulated values
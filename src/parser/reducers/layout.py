@@ -4,10 +4,13 @@
 from typing import Callable, Iterable, List, Set, Tuple, Union
 
 # Third-Party Imports
+import numpy as np
 from pdfminer.layout import LTItem
 
 # Local Imports
+from .. import callbacks as cb
 from ..abstractors import get_position
+from ..models.page import CompactPage
 
 
 def reduce_positions(
@@ -18,14 +21,20 @@ def reduce_positions(
     """
     Return the positions of all objects in a container.
     :param accumulator: an instance of list or set.
-    :param container: an instance of an LTItem object or an iterable containing them.
-    :param callbacks: functions to filter the items.
+    :param container: an instance of an LTItem object, a CompactPage or an iterable containing them.
+    :param callbacks: functions to filter the items, which must be positional for a CompactPage.
     """
+    # The positions of the items directly on a compact page are read from its arrays
+    if isinstance(container, CompactPage):
+        indexes = np.flatnonzero((container.parents == -1) & cb.mask(container.bboxes, *callbacks))
+        return _accumulate(accumulator, container.positions(indexes))
+
+    predicate = cb.compose(*callbacks)
     # Extract the positions of all objects
     positions = [
         get_position(obj)
         for obj in container
-        if all(map(lambda cb: cb(obj), callbacks))
+        if predicate(obj)
     ]
     # return accumulated values
     return _accumulate(accumulator, positions)
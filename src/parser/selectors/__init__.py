@@ -1,7 +1,7 @@
 # parser/pdfminer/selectors/__init__.py
 
 from .pages import select_pages
-from .rectangles import select_rectangles
-from .textboxes import select_textboxes
-from .lines import select_lines
-from .characters import select_characters
+from .rectangles import iter_rectangles, select_rectangles
+from .textboxes import iter_textboxes, select_textboxes
+from .lines import iter_lines, select_lines
+from .characters import iter_characters, select_characters
@@ -0,0 +1,55 @@
+# parsers/pdfminer/selectors/buckets.py
+
+# Standard Imports
+from typing import Dict, List
+from weakref import WeakKeyDictionary
+
+# Third-Party Imports
+from pdfminer.layout import LTChar, LTCurve, LTPage, LTRect, LTTextBox, LTTextLine
+
+# Buckets are released as soon as their page is garbage collected
+_buckets: "WeakKeyDictionary[LTPage, Dict[str, List]]" = WeakKeyDictionary()
+
+
+def bucket_page(page: LTPage) -> Dict[str, List]:
+    """Return the descendants of a page grouped by type.
+
+    The first time a page is touched, its textboxes, lines, characters,
+    rectangles and curves are collected in a single walk; later selections
+    on the same page are served from those buckets. Pages are assumed not
+    to change once their layout has been analyzed."""
+    if page not in _buckets:
+        _buckets[page] = _build_buckets(page)
+    return _buckets[page]
+
+
+def _build_buckets(page: LTPage) -> Dict[str, List]:
+    """Walk a page and group its descendants by type.
+
+    This function is designed to help select layout items
+    and should not be imported into other modules."""
+    buckets = {
+        'textboxes': [],
+        'lines': [],
+        'characters': [],
+        'rectangles': [],
+        'curves': [],
+    }
+
+    for element in page:
+        if isinstance(element, LTTextBox):
+            buckets['textboxes'].append(element)
+            for line in element:
+                if isinstance(line, LTTextLine):
+                    buckets['lines'].append(line)
+                    buckets['characters'].extend(
+                        char for char in line if isinstance(char, LTChar)
+                    )
+
+        elif isinstance(element, LTRect):
+            buckets['rectangles'].append(element)
+
+        elif isinstance(element, LTCurve):
+            buckets['curves'].append(element)
+
+    return buckets
@@ -1,21 +1,50 @@
 # parsers/pdfminer/selectors/characters.py
 
 # Standard Imports
-from typing import Callable, Iterable, Iterator, Union
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
 
 # Third-Party Imports
 from pdfminer.layout import LTComponent, LTCurve, LTPage, LTTextBox, LTTextLine, LTChar
 
 # Local Imports
-from .lines import select_lines
-from .textboxes import select_textboxes
+from .. import callbacks as cb
+from ..models.page import CHARACTER, TEXTBOX, TEXTLINE, CompactPage
+from .buckets import bucket_page
+from .compact import select_compact
 
 
 def select_characters(
     container: Union[Iterable, LTComponent],
-    *callbacks: Callable
+    *callbacks: Callable,
+    region: Tuple = None
+    ) -> Iterator[LTChar]:
+    """Select instances of LTChar objects.
+
+    When a region is provided, only characters within it are selected and
+    containers which do not overlap it are skipped without being expanded.
+    For a CompactPage, the indexes of the selected characters are returned."""
+    # Select the items of a compact page over its arrays, returning their indexes
+    if isinstance(container, CompactPage):
+        return select_compact(container, CHARACTER, *callbacks, region=region, ancestors=(TEXTLINE, TEXTBOX))
+
+    # Fuse the callbacks and region into predicates built once for the whole selection
+    if region is not None:
+        return _select_characters(
+            container, cb.compose(cb.within(region), *callbacks), cb.intersects(region)
+        )
+
+    return _select_characters(container, cb.compose(*callbacks))
+
+
+def _select_characters(
+    container: Union[Iterable, LTComponent],
+    predicate: Callable,
+    overlaps: Optional[Callable] = None
     ) -> Iterator[LTChar]:
-    """Select instances of LTChar objects."""
+    """Select instances of LTChar objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTChar objects
+    and should not be imported into other modules."""
 
     # If argument is not an instance of an LTComponent and not iterable, it is not an appropriate argument type
     if not isinstance(container, LTComponent) and not isinstance(container, Iterable):
@@ -26,30 +55,30 @@ def select_characters(
     if isinstance(container, LTCurve):
         return []
 
+    # If argument lies outside the region, none of its characters can be selected
+    if overlaps is not None and isinstance(container, LTComponent) and not overlaps(container):
+        return []
+
     # if argument is a single LTChar object, return it
     if isinstance(container, LTChar):
-        return (
-            [container]
-            if all(map(lambda cb: cb(container), callbacks))
-            else []
-        )
-    
+        return [container] if predicate(container) else []
+
     characters = []
     # ensure argument is an LTTextLine object, then yield characters
     if isinstance(container, LTTextLine):
-        characters.extend(_characters_from_line(container, *callbacks))
-    
+        characters.extend(_characters_from_line(container, predicate))
+
     # for LTTextBox objects, retrieve the lines first
     elif isinstance(container, LTTextBox):
-        characters.extend(_characters_from_textbox(container, *callbacks))
-    
+        characters.extend(_characters_from_textbox(container, predicate, overlaps))
+
     # for LTPage objects, retrieve the textboxes first
     elif isinstance(container, LTPage):
-        characters.extend(_characters_from_page(container, *callbacks))
+        characters.extend(_characters_from_page(container, predicate, overlaps))
 
     # check whether the object is iterable and may yield pages, textboxes, lines or characters
     elif isinstance(container, Iterable):
-        characters.extend(_characters_from_iterable(container, *callbacks))
+        characters.extend(_characters_from_iterable(container, predicate, overlaps))
 
     # otherwise return an empty list
     else:
@@ -58,31 +87,42 @@ def select_characters(
     return characters
 
 
-def _characters_from_page(page: LTPage, *callbacks: Callable):
+def _characters_from_page(page: LTPage, predicate: Callable, overlaps: Optional[Callable] = None):
     """Select instances of LTChar from a LTPage object.
 
     This function is designed to help select instances of LTChar objects
     and should not be imported into other modules."""
+    # Only expand the textboxes which overlap the region
+    if overlaps is not None:
+        return [
+            char
+            for textbox in bucket_page(page)['textboxes']
+            if overlaps(textbox)
+            for char in _characters_from_textbox(textbox, predicate, overlaps)
+        ]
+
     return [
         char
-        for textbox in select_textboxes(page)
-        for char in select_characters(textbox, *callbacks)
+        for char in bucket_page(page)['characters']
+        if predicate(char)
     ]
 
 
-def _characters_from_textbox(textbox: LTTextBox, *callbacks: Callable):
+def _characters_from_textbox(textbox: LTTextBox, predicate: Callable, overlaps: Optional[Callable] = None):
     """Select instances of LTChar from a LTTextBox object.
 
     This function is designed to help select instances of LTChar objects
     and should not be imported into other modules."""
     return [
         char
-        for line in select_lines(textbox)
-        for char in select_characters(line, *callbacks)
+        for line in textbox
+        if isinstance(line, LTTextLine)
+        and (overlaps is None or overlaps(line))
+        for char in _characters_from_line(line, predicate)
     ]
 
 
-def _characters_from_line(line: LTTextLine, *callbacks: Callable):
+def _characters_from_line(line: LTTextLine, predicate: Callable):
     """Select instances of LTChar from a LTTextLine object.
 
     This function is designed to help select instances of LTChar objects
@@ -91,11 +131,11 @@ def _characters_from_line(line: LTTextLine, *callbacks: Callable):
         char
         for char in line
         if isinstance(char, LTChar)
-        and all(map(lambda cb: cb(char), callbacks))
+        and predicate(char)
     ]
 
 
-def _characters_from_iterable(container: Iterable, *callbacks: Callable):
+def _characters_from_iterable(container: Iterable, predicate: Callable, overlaps: Optional[Callable] = None):
     """Select instances of LTChar from an iterable object.
 
     This function is designed to help select instances of LTChar objects
@@ -103,5 +143,64 @@ def _characters_from_iterable(container: Iterable, *callbacks: Callable):
     return [
         char
         for element in container
-        for char in select_characters(element, *callbacks)
+        for char in _select_characters(element, predicate, overlaps)
     ]
+
+
+def iter_characters(
+    container: Union[Iterable, LTComponent],
+    *callbacks: Callable
+    ) -> Iterator[LTChar]:
+    """Lazily yield instances of LTChar objects.
+
+    Unlike select_characters(), matches are yielded depth-first as they are
+    found without building intermediate lists, so callers can stop early."""
+    # Select the items of a compact page over its arrays, yielding their indexes
+    if isinstance(container, CompactPage):
+        return iter(select_compact(container, CHARACTER, *callbacks, ancestors=(TEXTLINE, TEXTBOX)))
+
+    # Fuse the callbacks into a single predicate built once for the whole traversal
+    return _iter_characters(container, cb.compose(*callbacks))
+
+
+def _iter_characters(container: Union[Iterable, LTComponent], predicate: Callable) -> Iterator[LTChar]:
+    """Lazily yield instances of LTChar objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTChar objects
+    and should not be imported into other modules."""
+
+    # If argument is not an instance of an LTComponent and not iterable, it is not an appropriate argument type
+    if not isinstance(container, LTComponent) and not isinstance(container, Iterable):
+        raise TypeError(f"{type(container)} is not a valid argument type")
+
+    # If argument is an instance of an LTCurve, it will not contain text
+    if isinstance(container, LTCurve):
+        return
+
+    # if argument is a single LTChar object, yield it
+    if isinstance(container, LTChar):
+        if predicate(container):
+            yield container
+
+    # ensure argument is an LTTextLine object, then yield characters
+    elif isinstance(container, LTTextLine):
+        for char in container:
+            if isinstance(char, LTChar) and predicate(char):
+                yield char
+
+    # for LTTextBox objects, retrieve the lines first
+    elif isinstance(container, LTTextBox):
+        for line in container:
+            if isinstance(line, LTTextLine):
+                yield from _iter_characters(line, predicate)
+
+    # for LTPage objects, retrieve the textboxes first
+    elif isinstance(container, LTPage):
+        for textbox in container:
+            if isinstance(textbox, LTTextBox):
+                yield from _iter_characters(textbox, predicate)
+
+    # check whether the object is iterable and may yield pages, textboxes, lines or characters
+    elif isinstance(container, Iterable):
+        for element in container:
+            yield from _iter_characters(element, predicate)
@@ -0,0 +1,38 @@
+# src/parser/selectors/compact.py
+
+# Standard Imports
+from typing import Callable, Sequence, Tuple
+
+# Third-Party Imports
+import numpy as np
+
+# Local Imports
+from .. import callbacks as cb
+from ..models.page import CompactPage
+
+
+def select_compact(
+    page: CompactPage,
+    kind: int,
+    *callbacks: Callable,
+    region: Tuple = None,
+    ancestors: Sequence[int] = ()
+    ) -> np.ndarray:
+    """Return the indexes of the items of a kind on a compact page.
+
+    Items are only selected when they are nested in items of the ancestor
+    kinds, listed from the parent upwards, which lie directly on the page;
+    this matches the items an LTPage yields to the other selectors. Only
+    callbacks created by within(), between() and intersects() can be
+    evaluated over the arrays of a compact page."""
+    indexes = page.select(kind, boundary=region)
+    keep = cb.mask(page.bboxes[indexes], *callbacks)
+
+    # Walk up from the selected items through each of their ancestors
+    nodes = indexes
+    for ancestor in ancestors:
+        nodes = page.parents[nodes]
+        keep &= (nodes >= 0) & (page.kinds[nodes] == ancestor)
+    keep &= page.parents[nodes] == -1
+
+    return indexes[keep]
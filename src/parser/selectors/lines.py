@@ -1,20 +1,48 @@
 # parsers/pdfminer/selectors/lines.py
 
 # Standard Imports
-from typing import Callable, Iterable, Iterator, Union
+from typing import Callable, Iterable, Iterator, Optional, Tuple, Union
 
 # Third-Party Imports
 from pdfminer.layout import LTComponent, LTCurve, LTPage, LTTextBox, LTTextLine
 
 # Local Imports
-from .textboxes import select_textboxes
+from .. import callbacks as cb
+from ..models.page import TEXTBOX, TEXTLINE, CompactPage
+from .buckets import bucket_page
+from .compact import select_compact
 
 
 def select_lines(
     container: Union[Iterable, LTComponent],
-    *callbacks: Callable
+    *callbacks: Callable,
+    region: Tuple = None
     ) -> Iterator[LTTextLine]:
-    """Select instances of LTTextLine objects."""
+    """Select instances of LTTextLine objects.
+
+    When a region is provided, only lines within it are selected and
+    containers which do not overlap it are skipped without being expanded.
+    For a CompactPage, the indexes of the selected lines are returned."""
+    # Select the items of a compact page over its arrays, returning their indexes
+    if isinstance(container, CompactPage):
+        return select_compact(container, TEXTLINE, *callbacks, region=region, ancestors=(TEXTBOX,))
+
+    # Fuse the callbacks and region into predicates built once for the whole selection
+    if region is not None:
+        return _select_lines(container, cb.compose(cb.within(region), *callbacks), cb.intersects(region))
+
+    return _select_lines(container, cb.compose(*callbacks))
+
+
+def _select_lines(
+    container: Union[Iterable, LTComponent],
+    predicate: Callable,
+    overlaps: Optional[Callable] = None
+    ) -> Iterator[LTTextLine]:
+    """Select instances of LTTextLine objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTTextLine objects
+    and should not be imported into other modules."""
 
     # If argument is not an instance of an LTComponent and not iterable, it is not an appropriate argument type
     if not isinstance(container, LTComponent) and not isinstance(container, Iterable):
@@ -25,26 +53,26 @@ def select_lines(
     if isinstance(container, LTCurve):
         return []
 
+    # If argument lies outside the region, none of its lines can be selected
+    if overlaps is not None and isinstance(container, LTComponent) and not overlaps(container):
+        return []
+
     # if argument is a single LTTextLine object, return it
     if isinstance(container, LTTextLine):
-        return (
-            [container]
-            if all(map(lambda cb: cb(container), callbacks))
-            else []
-        )
-    
+        return [container] if predicate(container) else []
+
     lines = []
     # ensure argument is an LTTextBox object, then yield lines of text
     if isinstance(container, LTTextBox):
-        lines.extend(_lines_from_textbox(container, *callbacks))
+        lines.extend(_lines_from_textbox(container, predicate))
 
     # for an LTPage object, retrieve the textboxes first
     elif isinstance(container, LTPage):
-        lines.extend(_lines_from_page(container, *callbacks))
+        lines.extend(_lines_from_page(container, predicate, overlaps))
 
     # else if object is iterable, check for either pages, textboxes or lines
     elif isinstance(container, Iterable):
-        lines.extend(_lines_from_iterable(container, *callbacks))
+        lines.extend(_lines_from_iterable(container, predicate, overlaps))
 
     # otherwise return an empty list
     else:
@@ -53,19 +81,28 @@ def select_lines(
     return lines
 
 
-def _lines_from_page(page: LTPage, *callbacks: Callable):
+def _lines_from_page(page: LTPage, predicate: Callable, overlaps: Optional[Callable] = None):
     """Select instances of LTTextLine from a LTPage object.
 
     This function is designed to help select instances of LTTextLine objects
     and should not be imported into other modules."""
+    # Only expand the textboxes which overlap the region
+    if overlaps is not None:
+        return [
+            line
+            for textbox in bucket_page(page)['textboxes']
+            if overlaps(textbox)
+            for line in _lines_from_textbox(textbox, predicate)
+        ]
+
     return [
         line
-        for textbox in select_textboxes(page)
-        for line in select_lines(textbox, *callbacks)
+        for line in bucket_page(page)['lines']
+        if predicate(line)
     ]
 
 
-def _lines_from_textbox(textbox: LTTextBox, *callbacks: Callable):
+def _lines_from_textbox(textbox: LTTextBox, predicate: Callable):
     """Select instances of LTTextLine from a LTTextBox object.
 
     This function is designed to help select instances of LTTextLine objects
@@ -74,11 +111,11 @@ def _lines_from_textbox(textbox: LTTextBox, *callbacks: Callable):
         line
         for line in textbox
         if isinstance(line, LTTextLine)
-        and all(map(lambda cb: cb(line), callbacks))
+        and predicate(line)
     ]
 
 
-def _lines_from_iterable(container: Iterable, *callbacks: Callable):
+def _lines_from_iterable(container: Iterable, predicate: Callable, overlaps: Optional[Callable] = None):
     """Select instances of LTTextLine from an iterable object.
 
     This function is designed to help select instances of LTTextLine objects
@@ -86,5 +123,58 @@ def _lines_from_iterable(container: Iterable, *callbacks: Callable):
     return [
         line
         for element in container
-        for line in select_lines(element, *callbacks)
+        for line in _select_lines(element, predicate, overlaps)
     ]
+
+
+def iter_lines(
+    container: Union[Iterable, LTComponent],
+    *callbacks: Callable
+    ) -> Iterator[LTTextLine]:
+    """Lazily yield instances of LTTextLine objects.
+
+    Unlike select_lines(), matches are yielded depth-first as they are found
+    without building intermediate lists, so callers can stop early."""
+    # Select the items of a compact page over its arrays, yielding their indexes
+    if isinstance(container, CompactPage):
+        return iter(select_compact(container, TEXTLINE, *callbacks, ancestors=(TEXTBOX,)))
+
+    # Fuse the callbacks into a single predicate built once for the whole traversal
+    return _iter_lines(container, cb.compose(*callbacks))
+
+
+def _iter_lines(container: Union[Iterable, LTComponent], predicate: Callable) -> Iterator[LTTextLine]:
+    """Lazily yield instances of LTTextLine objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTTextLine objects
+    and should not be imported into other modules."""
+
+    # If argument is not an instance of an LTComponent and not iterable, it is not an appropriate argument type
+    if not isinstance(container, LTComponent) and not isinstance(container, Iterable):
+        raise TypeError(f"{type(container)} is not a valid argument type")
+
+    # If argument is an instance of an LTCurve, it will not contain text
+    if isinstance(container, LTCurve):
+        return
+
+    # if argument is a single LTTextLine object, yield it
+    if isinstance(container, LTTextLine):
+        if predicate(container):
+            yield container
+
+    # ensure argument is an LTTextBox object, then yield lines of text
+    elif isinstance(container, LTTextBox):
+        for line in container:
+            if isinstance(line, LTTextLine) and predicate(line):
+                yield line
+
+    # for an LTPage object, retrieve the textboxes first
+    elif isinstance(container, LTPage):
+        for textbox in container:
+            if isinstance(textbox, LTTextBox):
+                yield from _iter_lines(textbox, predicate)
+
+    # else if object is iterable, check for either pages, textboxes or lines
+    elif isinstance(container, Iterable):
+        for element in container:
+            yield from _iter_lines(element, predicate)
@@ -6,12 +6,17 @@ from typing import Callable, Iterable, Iterator, Union
 # Third-Party Imports
 from pdfminer.layout import LTComponent, LTCurve, LTPage
 
+# Local Imports
+from .. import callbacks as cb
+
 
 def select_pages(
     container: Union[Iterable[LTPage], LTPage],
     *callbacks: Callable
     ) -> Iterator[LTPage]:
     """Select instances of LTPage objects."""
+    # Fuse the callbacks into a single predicate built once for the whole selection
+    predicate = cb.compose(*callbacks)
 
     # If argument is not an instance of an LTComponent and not iterable, it is not an appropriate argument type
     if not isinstance(container, LTComponent) and not isinstance(container, Iterable):
@@ -26,14 +31,14 @@ def select_pages(
     if isinstance(container, LTPage):
         return (
             [container]
-            if all(map(lambda cb: cb(container), callbacks))
+            if predicate(container)
             else []
         )
 
     pages = []
     # check whether argument is iterable, then yield pages
     if isinstance(container, Iterable):
-        pages.extend(_pages_from_iterable(container, *callbacks))
+        pages.extend(_pages_from_iterable(container, predicate))
     
     # otherwise return an empty list
     else:
@@ -42,7 +47,7 @@ def select_pages(
     return pages
 
 
-def _pages_from_iterable(container: Iterable, *callbacks: Callable):
+def _pages_from_iterable(container: Iterable, predicate: Callable):
     """Select instances of LTPage objects from an iterable object.
 
     This function is designed to help select instances of LTPage objects
@@ -50,5 +55,5 @@ def _pages_from_iterable(container: Iterable, *callbacks: Callable):
     return [
         page for page in container
         if isinstance(page, LTPage) 
-        and all(map(lambda cb: cb(page), callbacks))
+        and predicate(page)
     ]
@@ -6,12 +6,33 @@ from typing import Callable, Iterable, Iterator
 # Third-Party Imports
 from pdfminer.layout import LTItem, LTPage, LTRect, LTTextContainer
 
+# Local Imports
+from .. import callbacks as cb
+from ..models.page import RECTANGLE, CompactPage
+from .buckets import bucket_page
+from .compact import select_compact
+
 
 def select_rectangles(
     container: Iterable,
     *callbacks: Callable
     ) -> Iterator[LTRect]:
-    """Select instances of LTRect objects."""
+    """Select instances of LTRect objects.
+
+    For a CompactPage, the indexes of the selected rectangles are returned."""
+    # Select the items of a compact page over its arrays, returning their indexes
+    if isinstance(container, CompactPage):
+        return select_compact(container, RECTANGLE, *callbacks)
+
+    # Fuse the callbacks into a single predicate built once for the whole selection
+    return _select_rectangles(container, cb.compose(*callbacks))
+
+
+def _select_rectangles(container: Iterable, predicate: Callable) -> Iterator[LTRect]:
+    """Select instances of LTRect objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTRect objects
+    and should not be imported into other modules."""
 
     # If argument is not an instance of an LTItem and not iterable, it is not an appropriate argument type
     if not isinstance(container, LTItem) and not isinstance(container, Iterable):
@@ -24,19 +45,19 @@ def select_rectangles(
 
     # if argument is a single LTRect object, return it
     if isinstance(container, LTRect):
-        return [container] if all(map(lambda cb: cb(container), callbacks)) else []
+        return [container] if predicate(container) else []
 
     rectangles = []
     # ensure argument is an LTPage object, then yield rectangles
     if isinstance(container, LTPage):
-        rectangles.extend(_rectangles_from_page(container, *callbacks))
+        rectangles.extend(_rectangles_from_page(container, predicate))
 
     # check whether the object is iterable and may yield either pages or rectangles
     elif isinstance(container, Iterable):
         rectangles.extend([
             rectangle
             for element in container
-            for rectangle in select_rectangles(element, *callbacks)
+            for rectangle in _select_rectangles(element, predicate)
         ])
     
     # otherwise return an empty list
@@ -46,14 +67,60 @@ def select_rectangles(
     return rectangles
 
 
-def _rectangles_from_page(page: LTPage, *callbacks: Callable):
+def _rectangles_from_page(page: LTPage, predicate: Callable):
     """Select instances of LTRect from a LTPage object.
 
     This function is designed to help select instances of LTRect objects
     and should not be imported into other modules."""
     return [
         rectangle
-        for rectangle in page
-        if isinstance(rectangle, LTRect)
-        and all(map(lambda cb: cb(rectangle), callbacks)) 
+        for rectangle in bucket_page(page)['rectangles']
+        if predicate(rectangle)
     ]
+
+
+def iter_rectangles(
+    container: Iterable,
+    *callbacks: Callable
+    ) -> Iterator[LTRect]:
+    """Lazily yield instances of LTRect objects.
+
+    Unlike select_rectangles(), matches are yielded depth-first as they are
+    found without building intermediate lists, so callers can stop early."""
+    # Select the items of a compact page over its arrays, yielding their indexes
+    if isinstance(container, CompactPage):
+        return iter(select_compact(container, RECTANGLE, *callbacks))
+
+    # Fuse the callbacks into a single predicate built once for the whole traversal
+    return _iter_rectangles(container, cb.compose(*callbacks))
+
+
+def _iter_rectangles(container: Iterable, predicate: Callable) -> Iterator[LTRect]:
+    """Lazily yield instances of LTRect objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTRect objects
+    and should not be imported into other modules."""
+
+    # If argument is not an instance of an LTItem and not iterable, it is not an appropriate argument type
+    if not isinstance(container, LTItem) and not isinstance(container, Iterable):
+        raise TypeError(f"{type(container)} is not a valid argument type")
+
+    # If argument is an instance of an LTTextContainer, it will not contain rectangles
+    if isinstance(container, LTTextContainer):
+        return
+
+    # if argument is a single LTRect object, yield it
+    if isinstance(container, LTRect):
+        if predicate(container):
+            yield container
+
+    # ensure argument is an LTPage object, then yield rectangles
+    elif isinstance(container, LTPage):
+        for rectangle in container:
+            if isinstance(rectangle, LTRect) and predicate(rectangle):
+                yield rectangle
+
+    # check whether the object is iterable and may yield either pages or rectangles
+    elif isinstance(container, Iterable):
+        for element in container:
+            yield from _iter_rectangles(element, predicate)
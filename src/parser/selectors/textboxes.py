@@ -6,12 +6,33 @@ from typing import Callable, Iterable, Iterator, Union
 # Third-Party Imports
 from pdfminer.layout import LTCurve, LTItem, LTPage, LTTextBox
 
+# Local Imports
+from .. import callbacks as cb
+from ..models.page import TEXTBOX, CompactPage
+from .buckets import bucket_page
+from .compact import select_compact
+
 
 def select_textboxes(
     container: Union[Iterable, LTItem],
     *callbacks: Callable
     ) -> Iterator[LTTextBox]:
-    """Select instances of LTTextBox objects."""
+    """Select instances of LTTextBox objects.
+
+    For a CompactPage, the indexes of the selected textboxes are returned."""
+    # Select the items of a compact page over its arrays, returning their indexes
+    if isinstance(container, CompactPage):
+        return select_compact(container, TEXTBOX, *callbacks)
+
+    # Fuse the callbacks into a single predicate built once for the whole selection
+    return _select_textboxes(container, cb.compose(*callbacks))
+
+
+def _select_textboxes(container: Union[Iterable, LTItem], predicate: Callable) -> Iterator[LTTextBox]:
+    """Select instances of LTTextBox objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTTextBox objects
+    and should not be imported into other modules."""
 
     # If argument is not an instance of an LTItem and not iterable, it is not an appropriate argument type
     if not isinstance(container, LTItem) and not isinstance(container, Iterable):
@@ -24,19 +45,19 @@ def select_textboxes(
 
     # if argument is a single LTTextBox object, return it
     if isinstance(container, LTTextBox):
-        return [container] if all(map(lambda cb: cb(container), callbacks)) else []
+        return [container] if predicate(container) else []
 
     textboxes = []
     # ensure argument is an LTPage object, then yield textboxes
     if isinstance(container, LTPage):
-        textboxes.extend(_textboxes_from_page(container, *callbacks))        
+        textboxes.extend(_textboxes_from_page(container, predicate))        
 
     # else if object is iterable, check for either pages or textboxes
     elif isinstance(container, Iterable):
         textboxes.extend([
             textbox
             for element in container
-            for textbox in select_textboxes(element, *callbacks)
+            for textbox in _select_textboxes(element, predicate)
         ])
 
     # otherwise return an empty list
@@ -46,14 +67,60 @@ def select_textboxes(
     return textboxes
 
 
-def _textboxes_from_page(page: LTPage, *callbacks: Callable):
+def _textboxes_from_page(page: LTPage, predicate: Callable):
     """Select instances of LTTextBox from a LTPage object.
 
     This function is designed to help select instances of LTTextBox objects
     and should not be imported into other modules."""
     return [
         textbox
-        for textbox in page
-        if isinstance(textbox, LTTextBox)
-        and all(map(lambda cb: cb(textbox), callbacks)) 
+        for textbox in bucket_page(page)['textboxes']
+        if predicate(textbox)
     ]
+
+
+def iter_textboxes(
+    container: Union[Iterable, LTItem],
+    *callbacks: Callable
+    ) -> Iterator[LTTextBox]:
+    """Lazily yield instances of LTTextBox objects.
+
+    Unlike select_textboxes(), matches are yielded depth-first as they are
+    found without building intermediate lists, so callers can stop early."""
+    # Select the items of a compact page over its arrays, yielding their indexes
+    if isinstance(container, CompactPage):
+        return iter(select_compact(container, TEXTBOX, *callbacks))
+
+    # Fuse the callbacks into a single predicate built once for the whole traversal
+    return _iter_textboxes(container, cb.compose(*callbacks))
+
+
+def _iter_textboxes(container: Union[Iterable, LTItem], predicate: Callable) -> Iterator[LTTextBox]:
+    """Lazily yield instances of LTTextBox objects which pass a composed predicate.
+
+    This function is designed to help select instances of LTTextBox objects
+    and should not be imported into other modules."""
+
+    # If argument is not an instance of an LTItem and not iterable, it is not an appropriate argument type
+    if not isinstance(container, LTItem) and not isinstance(container, Iterable):
+        raise TypeError(f"{type(container)} is not a valid argument type")
+
+    # If argument is an instance of an LTCurve, it will not contain text
+    if isinstance(container, LTCurve):
+        return
+
+    # if argument is a single LTTextBox object, yield it
+    if isinstance(container, LTTextBox):
+        if predicate(container):
+            yield container
+
+    # ensure argument is an LTPage object, then yield textboxes
+    elif isinstance(container, LTPage):
+        for textbox in container:
+            if isinstance(textbox, LTTextBox) and predicate(textbox):
+                yield textbox
+
+    # else if object is iterable, check for either pages or textboxes
+    elif isinstance(container, Iterable):
+        for element in container:
+            yield from _iter_textboxes(element, predicate)
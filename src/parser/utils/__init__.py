@@ -1,4 +1,6 @@
 # parser/pdfminer/utils/__init__.py
 
+from .intervals import *
 from .positions import *
+from .spatial import *
 from .typography import *
@@ -0,0 +1,87 @@
+# parser/pdfminer/utils/intervals.py
+
+# Standard Imports
+from bisect import bisect_left, bisect_right, insort
+from math import inf
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+
+class IntervalSet:
+    """A set of intervals kept sorted by their start and then their end.
+
+    Each interval is a tuple of a start and an end, such as the left and right
+    sides of a column or the bottom and top of a row, with the start no greater
+    than the end. Membership, containment and overlap queries use a binary
+    search over the sorted intervals, so candidates for columns and rows can
+    be collected without comparing every interval against every other."""
+
+    def __init__(self, intervals: Iterable[Tuple] = ()):
+        self._intervals: List[Tuple] = sorted(set(intervals))
+        self._longest = max((end - start for start, end in self._intervals), default=0)
+
+    def __contains__(self, interval: Tuple) -> bool:
+        idx = bisect_left(self._intervals, interval)
+        return idx < len(self._intervals) and self._intervals[idx] == interval
+
+    def __iter__(self) -> Iterator[Tuple]:
+        return iter(self._intervals)
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def add(self, interval: Tuple) -> None:
+        """Add an interval, unless it is already present."""
+        if interval not in self:
+            insort(self._intervals, interval)
+            self._longest = max(self._longest, interval[1] - interval[0])
+
+    def discard(self, interval: Tuple) -> None:
+        """Remove an interval, if it is present."""
+        idx = bisect_left(self._intervals, interval)
+        if idx < len(self._intervals) and self._intervals[idx] == interval:
+            del self._intervals[idx]
+
+    def update(self, intervals: Iterable[Tuple]) -> None:
+        """Add several intervals."""
+        for interval in intervals:
+            self.add(interval)
+
+    def within(self, boundary: Tuple) -> List[Tuple]:
+        """Return the intervals which lie entirely within a boundary.
+
+        Matches the behaviour of callbacks.between(boundary)."""
+        return _within(self._intervals, boundary)
+
+    def overlapping(self, boundary: Tuple) -> List[Tuple]:
+        """Return the intervals which share any part of a boundary."""
+        # No interval starting further left than the longest one can reach the boundary
+        start = bisect_left(self._intervals, (boundary[0] - self._longest,))
+        stop = bisect_right(self._intervals, (boundary[1], inf))
+        return [
+            interval for interval in self._intervals[start:stop]
+            if interval[1] >= boundary[0]
+        ]
+
+    def replace_parents(self, intervals: Iterable[Tuple]) -> None:
+        """Add intervals, first removing any interval which contains more than one of them."""
+        children = sorted(intervals)
+        parents = [
+            interval for interval in self._intervals
+            if len(_within(children, interval)) > 1
+        ]
+        for parent in parents:
+            self.discard(parent)
+        self.update(children)
+
+
+def _within(intervals: Sequence[Tuple], boundary: Tuple) -> List[Tuple]:
+    """Return the intervals of a sorted sequence which lie entirely within a boundary.
+
+    This function is designed to help query sets of intervals
+    and should not be imported into other modules."""
+    start = bisect_left(intervals, (boundary[0],))
+    stop = bisect_right(intervals, (boundary[1], inf))
+    return [
+        interval for interval in intervals[start:stop]
+        if interval[1] <= boundary[1]
+    ]
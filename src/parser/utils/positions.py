@@ -1,8 +1,9 @@
 # parser/pdfminer/utils/positions.py
 
 # Standard Imports
-from functools import reduce
-from typing import List, Tuple
+from bisect import bisect_left, bisect_right
+import heapq
+from typing import Iterable, List, Tuple
 
 # Third-Party Imports
 from pdfminer.layout import LTItem
@@ -35,37 +36,93 @@ def merge_positions(*positions):
 
 
 def merge_overlapping_positions(*positions: Tuple) -> List:
-    """Merge overlapping positions and return any that are distinct."""
-    result = reduce(_merge_on_overlap, positions, []) if len(positions) > 0 else []
-    return result
+    """Merge overlapping positions and return any that are distinct.
+
+    Positions are sorted by their leading edge and swept in a single pass,
+    so merging takes O(n log n) time rather than rescanning every distinct
+    position for each new one."""
+    if len(positions) == 0:
+        return []
+
+    # Sanity check
+    dimensions = {len(position) for position in positions}
+    if len(dimensions) != 1 or not dimensions.issubset({2, 4}):
+        raise ValueError(f"cannot merge positions with {dimensions} dimensions")
+
+    if dimensions == {2}:
+        result = _merge_overlapping_intervals(positions)
+    else:
+        result = _merge_overlapping_boxes(positions)
+
+    # Return all unique positions
+    return sorted(result, key=lambda pos: (pos[0], pos[-1]))
+
 
+def _merge_overlapping_intervals(positions: Iterable[Tuple]) -> List:
+    """Merge overlapping intervals with a sweep from left to right.
 
-def _merge_on_overlap(accumulator: List, position: Tuple) -> List:
-    """Merge overlapping positions.
-    
     This function is designed to help merge positions
     and should not be imported into other modules."""
+    merged = []
+    for position in sorted(positions):
+        # Positions which touch or overlap the previous interval extend it
+        if merged and position[0] <= merged[-1][1]:
+            merged[-1] = merge_positions(merged[-1], position)
+        else:
+            merged.append(tuple(position))
+    return merged
+
+
+def _merge_overlapping_boxes(positions: Iterable[Tuple]) -> List:
+    """Merge touching or overlapping bounding boxes into their enclosing boxes.
+
+    Boxes are swept from left to right. Every active box spans the sweep
+    line, so active boxes which do not touch have disjoint vertical extents
+    and are kept in order of their bottom edge; those touching a new box
+    are found with a binary search and merged into it. A merged box can
+    reach one which was retired earlier, so the merged boxes are swept
+    again until a sweep merges nothing, with each sweep over fewer boxes.
 
-    # Sanity check
-    if len(position) != 2 and len(position) != 4:
-        raise ValueError(f"cannot merge positions with {len(position)} dimensions")
+    This function is designed to help merge positions
+    and should not be imported into other modules."""
+    merged = [tuple(position) for position in positions]
+    while True:
+        result = _sweep_boxes(merged)
+        if len(result) == len(merged):
+            return result
+        merged = result
 
-    unique_positions = []
-    for pos in accumulator:
-        if len(position) == 2 and \
-            (position[0] > pos[1] or position[1] < pos[0]):    # positions do not overlap
-            unique_positions.append(pos)                       # therefore position is unique
 
-        elif len(position) == 4 and \
-            (position[0] > pos[2] or position[2] < pos[0]      # positions do not overlap horizontally
-            or position[1] > pos[3] or position[3] < pos[0]):  # positions do not overlap vertically
-            unique_positions.append(pos)                       # therefore position is unique
+def _sweep_boxes(positions: List[Tuple]) -> List:
+    """Merge bounding boxes which touch the same box during a single sweep.
 
-        else:                                                  # positions overlap
-            position = merge_positions(position, pos)          # therefore merge them
+    This function is designed to help merge positions
+    and should not be imported into other modules."""
+    result = []
+    bottoms, tops, active = [], [], []  # ordered by bottom edge
+    retiring = []  # heap of right edges and bottom edges of active boxes
+
+    for position in sorted(positions):
+        # Retire boxes which end before the current box begins
+        while retiring and retiring[0][0] < position[0]:
+            right, bottom = heapq.heappop(retiring)
+            idx = bisect_left(bottoms, bottom)
+            if idx < len(active) and bottoms[idx] == bottom and active[idx][2] == right:
+                result.append(active.pop(idx))
+                del bottoms[idx], tops[idx]
+
+        # Merge the run of active boxes which touch the current box vertically
+        start = bisect_left(tops, position[1])
+        stop = bisect_right(bottoms, position[3])
+        if start < stop:
+            position = merge_positions(position, *active[start:stop])
+            del active[start:stop], bottoms[start:stop], tops[start:stop]
+
+        active.insert(start, position)
+        bottoms.insert(start, position[1])
+        tops.insert(start, position[3])
+        heapq.heappush(retiring, (position[2], position[1]))
+
+    result.extend(active)
+    return result
 
-    # Return all unique positions
-    return sorted(
-        [position] + unique_positions,
-        key=lambda pos: (pos[0], pos[-1])
-    )
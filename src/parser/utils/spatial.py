@@ -0,0 +1,51 @@
+# parser/pdfminer/utils/spatial.py
+
+# Standard Imports
+from bisect import bisect_left, bisect_right
+from typing import Iterable, List, Tuple
+
+# Third-Party Imports
+from pdfminer.layout import LTItem
+
+
+class SpatialIndex:
+    """An index of layout items sorted by their bottom edge.
+
+    The index is built once per page so that repeated region queries,
+    such as selecting the lines inside each cell of a table, become a
+    binary search followed by a scan of the items in the same band
+    instead of a walk over every item on the page."""
+
+    def __init__(self, items: Iterable[LTItem]):
+        self._original = list(items)
+
+        # Remember the original order so results match the selectors
+        ordered = sorted(enumerate(self._original), key=lambda entry: entry[1].y0)
+        self._order = [order for order, _ in ordered]
+        self._items = [item for _, item in ordered]
+        self._bottoms = [item.y0 for item in self._items]
+
+    def __iter__(self):
+        return iter(self._original)
+
+    def __len__(self):
+        return len(self._items)
+
+    def within(self, boundary: Tuple, margin: float = 0) -> List[LTItem]:
+        """Return the items which lie within a boundary, in their original order.
+
+        Matches the behaviour of callbacks.within(boundary, margin)."""
+        left, bottom, right, top = boundary
+
+        # Items must start above the bottom and, by extension, below the top
+        start = bisect_left(self._bottoms, bottom - margin)
+        stop = bisect_right(self._bottoms, top + margin)
+
+        matches = [
+            (self._order[idx], item)
+            for idx, item in zip(range(start, stop), self._items[start:stop])
+            if item.x0 >= left - margin
+            and item.x1 <= right + margin
+            and item.y1 <= top + margin
+        ]
+        return [item for _, item in sorted(matches, key=lambda match: match[0])]
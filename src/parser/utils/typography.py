@@ -1,33 +1,216 @@
 # parser/pdfminer/utils/typography.py
 
 # Standard Imports
+from collections import Counter
 import statistics
+from typing import Any, Dict, Iterable, Text, Tuple, Union
+from weakref import WeakKeyDictionary
 
 # Third-Party Imports
-from pdfminer.layout import LTItem
+import numpy as np
+from pdfminer.layout import LTChar, LTCurve, LTItem, LTPage, LTTextBox, LTTextLine
 
 # Local Imports
-from ..reducers.design import reduce_fontnames
-from ..reducers.design import reduce_fontsizes
-from ..reducers.design import reduce_fontweights
-from ..reducers.design import reduce_typefaces
+from ..abstractors import get_fontname, get_fontsize, get_fontweight, get_typeface
+
+# Profiles are released as soon as their layout item is garbage collected
+_profiles: "WeakKeyDictionary[LTItem, TypographyProfile]" = WeakKeyDictionary()
+
+
+class TypographyProfile:
+    """Histograms of the fonts used by the characters in a container.
+
+    Fontnames, fontsizes, fontweights and typefaces are counted in a single
+    pass over the characters. Profiles are also kept for every page and line
+    within the container, so that the typography of each can be compared
+    with the container as a whole without counting its characters again.
+    Pages and lines are held by weak references, so a profile never keeps
+    the layout it describes alive."""
+
+    def __init__(self):
+        self.fontnames = Counter()
+        self.fontsizes = Counter()
+        self.fontweights = Counter()
+        self.typefaces = Counter()
+        self.pages: "WeakKeyDictionary[LTPage, TypographyProfile]" = WeakKeyDictionary()
+        self.lines: "WeakKeyDictionary[LTTextLine, TypographyProfile]" = WeakKeyDictionary()
+
+    @classmethod
+    def from_container(cls, container: Union[Iterable, LTItem]) -> 'TypographyProfile':
+        """Build a profile of the characters selected from a container."""
+        profile = cls()
+        profile._add(container)
+        return profile
+
+    def most_common_fontname(self):
+        """Return the most common fontname."""
+        return _mode(self.fontnames)
+
+    def most_common_fontsize(self):
+        """Return the most common fontsize."""
+        return _mode(self.fontsizes)
+
+    def most_common_fontweight(self):
+        """Return the most common fontweight."""
+        return _mode(self.fontweights)
+
+    def most_common_typeface(self):
+        """Return the most common typeface."""
+        return _mode(self.typefaces)
+
+    def _add(self, container: Union[Iterable, LTItem]) -> None:
+        # Characters are visited in the same order as select_characters()
+        if isinstance(container, LTCurve):
+            return
+
+        if isinstance(container, LTChar):
+            self._count(container)
+
+        elif isinstance(container, LTTextLine):
+            self._merge(self._profile_line(container))
+
+        elif isinstance(container, LTTextBox):
+            for line in container:
+                if isinstance(line, LTTextLine):
+                    self._merge(self._profile_line(line))
+
+        elif isinstance(container, LTPage):
+            page = TypographyProfile()
+            for textbox in container:
+                if isinstance(textbox, LTTextBox):
+                    page._add(textbox)
+            self.pages[container] = page
+            self.lines.update(page.lines)
+            self._merge(page)
+
+        elif isinstance(container, Iterable):
+            for element in container:
+                self._add(element)
+
+    def _profile_line(self, line: LTTextLine) -> 'TypographyProfile':
+        profile = TypographyProfile()
+        for char in line:
+            if isinstance(char, LTChar):
+                profile._count(char)
+        self.lines[line] = profile
+        return profile
+
+    def _count(self, char: LTChar) -> None:
+        self.fontnames[get_fontname(char)] += 1
+        self.fontsizes[get_fontsize(char)] += 1
+        self.fontweights[get_fontweight(char)] += 1
+        self.typefaces[get_typeface(char)] += 1
+
+    def _merge(self, other: 'TypographyProfile') -> None:
+        self.fontnames.update(other.fontnames)
+        self.fontsizes.update(other.fontsizes)
+        self.fontweights.update(other.fontweights)
+        self.typefaces.update(other.typefaces)
+
+
+def profile_typography(container: Union[Iterable, LTItem]) -> TypographyProfile:
+    """Return the typography profile of a container.
+
+    Profiles of layout items, including the pages and lines counted while
+    profiling a larger container, are kept until the item is released."""
+    try:
+        return _profiles[container]
+    except (KeyError, TypeError):
+        pass
+
+    profile = TypographyProfile.from_container(container)
+    for item, child in {**profile.pages, **profile.lines}.items():
+        _profiles[item] = child
+    _cache_profile(container, profile)
+    return profile
 
 
 def most_common_fontname(container: LTItem):
     """Return the most common fontname in the provided container."""
-    return statistics.mode(reduce_fontnames([], container))
+    return profile_typography(container).most_common_fontname()
 
 
 def most_common_fontsize(container: LTItem):
     """Return the most common fontsize in the provided container."""
-    return statistics.mode(reduce_fontsizes([], container))
+    return profile_typography(container).most_common_fontsize()
 
 
 def most_common_fontweight(container: LTItem):
     """Return the most common fontweight in the provided container."""
-    return statistics.mode(reduce_fontweights([], container))
+    return profile_typography(container).most_common_fontweight()
 
 
 def most_common_typeface(container: LTItem):
     """Return the most common typeface in the provided container."""
-    return statistics.mode(reduce_typefaces([], container))
+    return profile_typography(container).most_common_typeface()
+
+
+def most_common_fonts_by_line(lines: Iterable[LTTextLine]) -> Dict[LTTextLine, Tuple[Text, float]]:
+    """Return the most common fontname and fontsize of each line.
+
+    The characters of every line are gathered into arrays in a single pass,
+    after which the mode of each line is found with a handful of NumPy
+    operations rather than one count per line. Lines without characters are
+    omitted, and ties resolve to the value seen first as statistics.mode() does."""
+    lines = list(lines)
+    groups, name_codes, fontsizes = [], [], []
+    fontnames: Dict[Text, int] = {}
+    for index, line in enumerate(lines):
+        for char in line:
+            if isinstance(char, LTChar):
+                groups.append(index)
+                name_codes.append(fontnames.setdefault(get_fontname(char), len(fontnames)))
+                fontsizes.append(get_fontsize(char))
+
+    if not groups:
+        return {}
+
+    groups = np.array(groups, dtype=np.int64)
+    size_values, size_codes = np.unique(np.array(fontsizes, dtype=np.float64), return_inverse=True)
+
+    line_indexes, name_modes = _group_modes(groups, np.array(name_codes, dtype=np.int64))
+    _, size_modes = _group_modes(groups, size_codes.ravel())
+
+    names = list(fontnames)
+    sizes = size_values.tolist()
+    return {
+        lines[index]: (names[name], sizes[size])
+        for index, name, size in zip(line_indexes.tolist(), name_modes.tolist(), size_modes.tolist())
+    }
+
+
+def _cache_profile(container: Any, profile: TypographyProfile) -> None:
+    """Keep the profile of a layout item, ignoring containers which cannot be cached.
+
+    This function is designed to help profile typography
+    and should not be imported into other modules."""
+    if isinstance(container, LTItem):
+        _profiles[container] = profile
+
+
+def _mode(histogram: Counter):
+    """Return the most common value, preferring the value seen first as statistics.mode() does.
+
+    This function is designed to help profile typography
+    and should not be imported into other modules."""
+    if not histogram:
+        raise statistics.StatisticsError("no mode for empty data")
+    return histogram.most_common(1)[0][0]
+
+
+def _group_modes(groups: np.ndarray, codes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the most common code within each group, preferring the code seen first.
+
+    This function is designed to help profile typography
+    and should not be imported into other modules."""
+    # Count each pair of group and code, remembering where it first appeared
+    width = codes.max() + 1
+    pairs = groups * width + codes
+    unique_pairs, first_seen, counts = np.unique(pairs, return_index=True, return_counts=True)
+    pair_groups, pair_codes = np.divmod(unique_pairs, width)
+
+    # Within each group, order by descending count and then by first appearance
+    order = np.lexsort((first_seen, -counts, pair_groups))
+    leaders = np.ones(len(order), dtype=bool)
+    leaders[1:] = pair_groups[order][1:] != pair_groups[order][:-1]
+    return pair_groups[order][leaders], pair_codes[order][leaders]
@@ -1,11 +1,15 @@
 # tests/integration/test_pdfminer_division_analyzer.py
 
 # Third-Party Imports
+from pdfminer.layout import LTTextBox
 import pytest
 
 # Local Imports
+from src.parser.analyzers.context import AnalysisContext
 from src.parser.analyzers.divisions import determine_column_positions
 from src.parser.analyzers.divisions import determine_row_positions
+from src.parser.analyzers.sections import determine_header_positions
+from src.parser.models.page import CompactPage
 
 
 def positionsAlmostEqual(first: list, second: list, delta: float) -> bool:
@@ -36,6 +40,21 @@ class TestDetermineColumnPositions():
     def alignment(self, request, text_alignment):
         yield text_alignment[request.param]
 
+    def test_reuses_columns_stored_in_context(self, border) -> None:
+        context = AnalysisContext()
+        first = determine_column_positions(border, context=context)
+        second = determine_column_positions(border, context=context)
+        assert first is second
+        assert first == determine_column_positions(border)
+
+    def test_separates_items_sharing_a_context(self, border) -> None:
+        context = AnalysisContext()
+        subset = [item for item in border if isinstance(item, LTTextBox)][:2]
+        determine_column_positions(border, context=context)
+        actual = determine_column_positions(*subset, context=context)
+        assert actual == determine_column_positions(*subset)
+        assert actual != determine_column_positions(border)
+
     def test_returns_list_of_tuples(self, columns) -> None:
         result = determine_column_positions(columns[0])
         assert isinstance(result, list)
@@ -77,6 +96,13 @@ class TestDetermineRowPositions():
     def alignment(self, request, text_alignment):
         yield text_alignment[request.param]
 
+    def test_separates_items_sharing_a_context(self, border) -> None:
+        context = AnalysisContext()
+        subset = [item for item in border if isinstance(item, LTTextBox)]
+        determine_row_positions(border, context=context)
+        actual = determine_row_positions(*subset, context=context)
+        assert actual == determine_row_positions(*subset)
+
     def test_returns_list_of_tuples(self, table_borders) -> None:
         result = determine_row_positions(table_borders[0])
         assert isinstance(result, list)
@@ -97,3 +123,15 @@ class TestDetermineRowPositions():
         expected = [(706.0, 719.5), (692.2, 705.5), (678.2, 691.7), (664.2, 677.7), (650.2, 663.7), (636.5, 649.7)]
         actual = determine_row_positions(alignment)
         assert positionsAlmostEqual(actual, expected, delta=5)
+
+
+class TestRejectingCompactPages():
+
+    @pytest.fixture(params=[determine_column_positions, determine_row_positions, determine_header_positions])
+    def analyzer(self, request):
+        return request.param
+
+    def test_raises_error_for_compact_page(self, analyzer, table_borders) -> None:
+        compact = CompactPage.from_layout(table_borders[0])
+        with pytest.raises(TypeError):
+            analyzer(compact)
@@ -1,22 +1,43 @@
 # tests/integration/test_pdfminer_extractors.py
 
 # Standard Imports
+from contextlib import contextmanager
+import io
+import mmap
 import os
+import pathlib
 from typing import Generator
 
 # Third-Party Imports
+import numpy as np
 import pandas as pd
+from pdfminer.converter import PDFPageAggregator
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser, PDFSyntaxError
 from pdfminer.layout import LTPage
 import pytest
 
 # Local Imports
+from src.parser.extractors.cache import LayoutCache
+from src.parser.extractors.devices import CompositeDevice
+from src.parser.extractors import document as document_module
+from src.parser.extractors import pages as pages_module
+from src.parser.extractors import tables as tables_module
+from src.parser.extractors.document import Document
 from src.parser.extractors.pages import extract_pages
+from src.parser.extractors.sources import open_pdf, spool_pdf
+from src.parser.models.page import CompactPage
 from src.parser.extractors.tables import extract_cell_content
 from src.parser.extractors.tables import extract_column_content
+from src.parser.extractors.tables import extract_grid_content
 from src.parser.extractors.tables import extract_row_content
 from src.parser.extractors.tables import extract_table_entry
 from src.parser.extractors.tables import extract_field_names
 from src.parser.extractors.tables import extract_table
+from src.parser.extractors.tables import iter_tables
+from src.parser.extractors.text import extract_text
 
 
 SAMPLES = 'tests/samples/'
@@ -43,6 +64,226 @@ class TestExtractingPages():
         result = list(extract_pages(test_pages))
         assert len(result) == 3
 
+    def test_returns_pages_in_order_when_using_workers(self, test_pages) -> None:
+        result = list(extract_pages(test_pages, workers=2))
+        assert [page.pageid for page in result] == [1, 2, 3]
+
+    def test_returns_pages_in_order_from_many_batches(self, test_pages, monkeypatch) -> None:
+        monkeypatch.setattr(pages_module, 'PAGES_PER_TASK', 1)
+        result = extract_pages(test_pages, workers=2, page_numbers=[0, 2])
+        assert isinstance(result, Generator)
+        assert [page.pageid for page in result] == [1, 3]
+
+    def test_returns_selected_pages(self, test_pages) -> None:
+        result = list(extract_pages(test_pages, page_numbers=[2]))
+        assert [page.pageid for page in result] == [3]
+
+    def test_returns_no_more_than_maxpages(self, test_pages) -> None:
+        result = list(extract_pages(test_pages, maxpages=2))
+        assert [page.pageid for page in result] == [1, 2]
+
+    def test_returns_pages_selected_by_generator(self, test_pages) -> None:
+        result = list(extract_pages(test_pages, page_numbers=(index for index in [1, 2])))
+        assert [page.pageid for page in result] == [2, 3]
+
+    def test_returns_no_pages_when_none_are_selected(self, test_pages) -> None:
+        assert list(extract_pages(test_pages, page_numbers=[])) == []
+
+
+class TestExtractingText():
+
+    @pytest.fixture(autouse=True)
+    def path(self) -> None:
+        return os.path.join(SAMPLES, '00_pages.pdf')
+
+    def test_returns_text_of_selected_pages(self, path) -> None:
+        result = extract_text(path, page_numbers=[2])
+        assert result.startswith('Page 3')
+        assert 'Page 1' not in result and 'Page 2' not in result
+
+    def test_returns_no_more_than_maxpages(self, path) -> None:
+        result = extract_text(path, maxpages=2)
+        assert 'Page 1' in result and 'Page 2' in result
+        assert 'Page 3' not in result
+
+    def test_returns_text_of_pages_selected_by_generator(self, path) -> None:
+        result = extract_text(path, page_numbers=(index for index in [1, 2]))
+        assert result == extract_text(path, page_numbers=[1, 2])
+        assert 'Page 2' in result
+
+    def test_applies_maxpages_to_selected_pages(self, path) -> None:
+        result = extract_text(path, page_numbers=[1, 2], maxpages=1)
+        assert result == extract_text(path, page_numbers=[1])
+
+    def test_returns_text_of_every_page_in_order(self, path) -> None:
+        expected = "".join(extract_text(path, page_numbers=[index]) for index in range(3))
+        assert extract_text(path) == expected
+
+
+class TestExtractingLeanPages():
+
+    @pytest.fixture(autouse=True)
+    def path(self) -> None:
+        return os.path.join(SAMPLES, '05_table_borders.pdf')
+
+    def test_returns_compact_pages(self, path) -> None:
+        result = list(extract_pages(path, maxpages=2, lean=True))
+        assert len(result) == 2
+        for page in result:
+            assert isinstance(page, CompactPage)
+
+    def test_returns_same_items_as_layout(self, path, table_borders) -> None:
+        expected = CompactPage.from_layout(table_borders[0])
+        actual = next(extract_pages(path, lean=True))
+        assert actual.pageid == expected.pageid
+        assert actual.text == expected.text
+        assert np.array_equal(actual.kinds, expected.kinds)
+        assert np.array_equal(actual.parents, expected.parents)
+        assert np.array_equal(actual.text_offsets, expected.text_offsets)
+        assert np.allclose(actual.bboxes, expected.bboxes)
+        assert np.allclose(actual.sizes, expected.sizes, equal_nan=True)
+
+    def test_returns_same_items_without_boxes_flow(self, path) -> None:
+        expected = CompactPage.from_layout(next(extract_pages(path, boxes_flow=None)))
+        actual = next(extract_pages(path, lean=True, boxes_flow=None))
+        assert actual.text == expected.text
+        assert np.array_equal(actual.parents, expected.parents)
+
+    def test_caches_compact_pages_apart_from_layouts(self, path, tmp_path) -> None:
+        list(extract_pages(path, maxpages=1, cache=str(tmp_path)))
+        result = list(extract_pages(path, maxpages=1, cache=str(tmp_path), lean=True))
+        assert isinstance(result[0], CompactPage)
+        assert len(list(tmp_path.glob('*.layout'))) == 2
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self, data: bytes):
+        self._stream = io.BytesIO(data)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        return self._stream.readinto(buffer)
+
+
+class TestOpeningSources():
+
+    @pytest.fixture(autouse=True)
+    def path(self) -> None:
+        return os.path.join(SAMPLES, '00_pages.pdf')
+
+    def test_maps_paths_into_memory(self, path) -> None:
+        with open_pdf(pathlib.Path(path)) as file:
+            assert isinstance(file, mmap.mmap)
+
+    def test_spools_unseekable_streams(self, path) -> None:
+        with open(path, 'rb') as file:
+            data = file.read()
+        with open_pdf(Unseekable(data), spool_size=16) as file:
+            assert file.read() == data
+            file.seek(0)
+            assert file.tell() == 0
+            assert file.read() == data
+
+    def test_returns_same_pages_from_any_source(self, path) -> None:
+        with open(path, 'rb') as file:
+            data = file.read()
+            expected = [str(list(page)) for page in extract_pages(file)]
+        for source in (path, pathlib.Path(path), Unseekable(data)):
+            assert [str(list(page)) for page in extract_pages(source)] == expected
+
+    def test_spools_streams_to_temporary_file(self, path) -> None:
+        with open(path, 'rb') as file:
+            data = file.read()
+            spooled = spool_pdf(file)
+        try:
+            with open(spooled, 'rb') as file:
+                assert file.read() == data
+        finally:
+            os.remove(spooled)
+
+    def test_returns_same_pages_from_stream_when_using_workers(self, path, monkeypatch) -> None:
+        with open(path, 'rb') as file:
+            data = file.read()
+            expected = [str(list(page)) for page in extract_pages(file)]
+
+        spooled = []
+        monkeypatch.setattr(pages_module, 'spool_pdf', lambda file: spooled.append(spool_pdf(file)) or spooled[-1])
+        actual = [str(list(page)) for page in extract_pages(Unseekable(data), workers=2)]
+        assert actual == expected
+        assert not os.path.exists(spooled[0])
+
+    def test_returns_same_text_from_any_source(self, path) -> None:
+        with open(path, 'rb') as file:
+            data = file.read()
+            expected = extract_text(file)
+        assert extract_text(path) == expected
+        assert extract_text(Unseekable(data)) == expected
+
+
+class TestLayoutCache():
+
+    @pytest.fixture(autouse=True)
+    def test_pages(self) -> None:
+        file = open(os.path.join(SAMPLES, '00_pages.pdf'), 'rb')
+        yield file
+        file.close()
+
+    def test_stores_a_layout_for_each_page(self, test_pages, tmp_path) -> None:
+        list(extract_pages(test_pages, cache=str(tmp_path)))
+        assert len(list(tmp_path.glob('*.layout'))) == 3
+
+    def test_returns_cached_pages_on_repeat_run(self, test_pages, tmp_path) -> None:
+        list(extract_pages(test_pages, cache=str(tmp_path)))
+        expected = [str(list(page)) for page in extract_pages(test_pages)]
+        actual = [str(list(page)) for page in extract_pages(test_pages, cache=str(tmp_path))]
+        assert actual == expected
+
+    def test_accepts_path_to_cache_directory(self, test_pages, tmp_path) -> None:
+        list(extract_pages(test_pages, cache=tmp_path / 'layouts'))
+        assert len(list((tmp_path / 'layouts').glob('*.layout'))) == 3
+
+    def test_creates_directory_readable_by_owner_only(self, tmp_path) -> None:
+        LayoutCache(tmp_path / 'layouts')
+        assert (tmp_path / 'layouts').stat().st_mode & 0o077 == 0
+
+    def test_evicts_layouts_when_full(self, test_pages, tmp_path) -> None:
+        cache = LayoutCache(str(tmp_path), max_size=1)
+        list(extract_pages(test_pages, cache=cache))
+        assert len(list(tmp_path.glob('*.layout'))) == 0
+
+    def test_reports_miss_when_layout_is_evicted_while_reading(self, tmp_path, monkeypatch) -> None:
+        cache = LayoutCache(str(tmp_path))
+        cache.put('key', [1, 2, 3])
+
+        def evicted(path):
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(os, 'utime', evicted)
+        assert cache.get('key') is None
+
+    def test_removes_stale_temporary_files(self, tmp_path) -> None:
+        stale = tmp_path / 'stale.tmp'
+        stale.write_bytes(b'0' * 1024)
+        os.utime(stale, (0, 0))
+        LayoutCache(str(tmp_path)).put('key', [1, 2, 3])
+        assert not stale.exists()
+
+    def test_counts_temporary_files_towards_limit(self, tmp_path) -> None:
+        (tmp_path / 'pending.tmp').write_bytes(b'0' * 1024)
+        LayoutCache(str(tmp_path), max_size=512).put('key', [1, 2, 3])
+        assert len(list(tmp_path.glob('*.layout'))) == 0
+
+    def test_tracks_size_without_rescanning(self, tmp_path, monkeypatch) -> None:
+        cache = LayoutCache(str(tmp_path))
+        cache.put('first', [1, 2, 3])
+        scans = []
+        monkeypatch.setattr(cache, '_evict', lambda: scans.append(True))
+        for key in range(10):
+            cache.put(str(key), [key])
+        assert not scans
+
 
 class TestExtractCellContent():
 
@@ -95,6 +336,50 @@ class TestExtractRowContent():
         assert actual == expected
 
 
+class TestExtractGridContent():
+
+    @pytest.fixture(scope="function", params=[i for i in range(5)])
+    def borders(self, request, table_borders):
+        yield table_borders[request.param]
+
+    def test_returns_list_of_rows(self, table_borders) -> None:
+        rows, columns = [(706.0, 719.5), (692.2, 705.5)], [(72.5, 164.0), (164.5, 259.1)]
+        result = extract_grid_content(table_borders[0], rows, columns)
+        assert isinstance(result, list)
+        assert all(map(lambda row: len(row) == 2, result))
+
+    def test_returns_correct_text(self, borders) -> None:
+        rows = [(706.0, 719.5), (692.2, 705.5)]
+        columns = [(72.5, 164.0), (164.5, 259.1), (259.6, 352.7), (353.2, 446.2), (446.7, 539.7)]
+        expected = [
+            ["IdField", "NameField", "TestField1", "TestField2", "TestField3"],
+            ["1", "Name1", "Value1", "Value2", "Value3"],
+        ]
+        actual = extract_grid_content(borders, rows, columns)
+        assert actual == expected
+
+    def test_matches_row_content_for_overlapping_boundaries(self, borders) -> None:
+        rows = [(692.2, 719.5), (706.0, 719.5), (692.2, 705.5)]
+        columns = [(72.5, 352.7), (164.5, 259.1), (72.5, 164.0), (259.6, 539.7), (353.2, 446.2)]
+        expected = [extract_row_content(borders, row, columns) for row in rows]
+        actual = extract_grid_content(borders, rows, columns)
+        assert actual == expected
+
+
+    def test_matches_row_content_for_adjacent_boundaries(self, borders) -> None:
+        rows = [(692.2, 706.0), (706.0, 719.5), (719.5, 730.0)]
+        columns = [(72.5, 164.0), (164.0, 259.6), (259.6, 353.2), (353.2, 446.7), (446.7, 539.7)]
+        expected = [extract_row_content(borders, row, columns) for row in rows]
+        actual = extract_grid_content(borders, rows, columns)
+        assert actual == expected
+
+    def test_bisects_boundaries_which_end_in_order(self, borders, monkeypatch) -> None:
+        rows = [(706.0, 719.5), (692.2, 705.5)]
+        columns = [(72.5, 164.0), (164.5, 259.1), (259.6, 352.7), (353.2, 446.2), (446.7, 539.7)]
+        monkeypatch.setattr(tables_module, '_scan_slots', None)
+        actual = extract_grid_content(borders, rows, columns)
+        assert actual[0][0] == "IdField"
+
 class TestExtractTableEntry():
 
     @pytest.fixture(scope="function", params=[i for i in range(5)])
@@ -236,3 +521,145 @@ class TestExtractingTable():
     #         result.columns,
     #         pd.Index(['IdField', 'NameField', 'TestField1', 'TestField2', 'TestField3'])
     #     )
+
+
+class TestIteratingTables():
+
+    def test_returns_iterator(self, page_overflow) -> None:
+        result = iter_tables(page_overflow[0:3])
+        assert isinstance(result, Generator)
+
+    def test_yields_one_table_per_page(self, page_overflow) -> None:
+        result = list(iter_tables(page_overflow[0:3]))
+        assert len(result) == 3
+        assert all(map(lambda table: isinstance(table, pd.DataFrame), result))
+
+    def test_consumes_pages_lazily(self, page_overflow) -> None:
+        pages = iter(page_overflow[0:3])
+        result = next(iter_tables(pages))
+        assert isinstance(result, pd.DataFrame)
+        assert len(list(pages)) == 2
+
+
+    def test_raises_error_for_compact_pages(self) -> None:
+        path = os.path.join(SAMPLES, '05_table_borders.pdf')
+        with pytest.raises(TypeError):
+            next(iter_tables(extract_pages(path, lean=True)))
+        with pytest.raises(TypeError):
+            extract_table(extract_pages(path, lean=True))
+        with pytest.raises(TypeError):
+            extract_table(next(extract_pages(path, lean=True)))
+
+class TestDocument():
+
+    @pytest.fixture(autouse=True)
+    def document(self) -> None:
+        with Document(os.path.join(SAMPLES, '00_pages.pdf')) as document:
+            yield document
+
+    def test_returns_same_pages_as_extract_pages(self, document) -> None:
+        with open(os.path.join(SAMPLES, '00_pages.pdf'), 'rb') as file:
+            expected = [str(list(page)) for page in extract_pages(file)]
+        actual = [str(list(page)) for page in document.pages()]
+        assert actual == expected
+
+    def test_analyzes_each_page_once(self, document) -> None:
+        first = list(document.pages(page_numbers=[0, 1]))
+        second = list(document.pages(maxpages=2))
+        assert all(map(lambda pair: pair[0] is pair[1], zip(first, second)))
+
+    def test_returns_same_text_as_extract_text(self, document) -> None:
+        with open(os.path.join(SAMPLES, '00_pages.pdf'), 'rb') as file:
+            expected = extract_text(file)
+        assert document.text() == expected
+
+    def test_interprets_each_page_once_for_text_and_pages(self, document, monkeypatch) -> None:
+        calls = []
+        process_page = document._interpreter.process_page
+        monkeypatch.setattr(
+            document._interpreter, 'process_page', lambda page: calls.append(page) or process_page(page)
+        )
+        document.text()
+        list(document.pages())
+        assert len(calls) == 3
+
+    def test_reads_page_labels_once(self, document, monkeypatch) -> None:
+        calls = []
+
+        def get_page_labels():
+            calls.append(None)
+            return iter(['i', 'ii', 'iii', 'iv'])
+
+        document._page_index()
+        document._pages.clear()
+        monkeypatch.setattr(document.document, 'get_page_labels', get_page_labels)
+        labels = [document._page(index).label for index in range(3)]
+        assert labels == ['i', 'ii', 'iii']
+        assert len(calls) == 1
+
+    def test_returns_single_page(self, document) -> None:
+        expected = [str(list(page)) for page in document.pages()]
+        with Document(os.path.join(SAMPLES, '00_pages.pdf')) as other:
+            assert str(list(other.page(2))) == expected[2]
+            assert other.page(2).pageid == 3
+            with pytest.raises(IndexError):
+                other.page(3)
+
+    def test_locates_pages_from_cached_index(self, tmp_path, monkeypatch) -> None:
+        path = os.path.join(SAMPLES, '00_pages.pdf')
+        with Document(path, boxes_flow=0.6) as document:
+            expected = [str(list(page)) for page in document.pages()]
+        with Document(path, cache=str(tmp_path)) as document:
+            document.page(0)
+
+        # Layouts analyzed with other parameters are not cached, but the page index is
+        monkeypatch.setattr(PDFPage, 'create_pages', lambda document: iter(()))
+        with Document(path, cache=str(tmp_path), boxes_flow=0.6) as document:
+            assert str(list(document.page(1))) == expected[1]
+            assert [str(list(page)) for page in document.pages()] == expected
+
+    def test_accepts_path_to_cache_directory(self, tmp_path) -> None:
+        with Document(os.path.join(SAMPLES, '00_pages.pdf'), cache=tmp_path) as document:
+            list(document.pages())
+        assert len(list(tmp_path.glob('*.layout'))) == 4
+
+    def test_selects_pages_by_generator(self, document) -> None:
+        result = list(document.pages(page_numbers=(index for index in [1, 2])))
+        assert [page.pageid for page in result] == [2, 3]
+
+    def test_closes_file_when_document_is_invalid(self, tmp_path, monkeypatch) -> None:
+        path = tmp_path / 'invalid.pdf'
+        path.write_bytes(b'not a pdf document')
+        opened = []
+
+        @contextmanager
+        def record(file):
+            with open_pdf(file) as source:
+                opened.append(source)
+                yield source
+
+        monkeypatch.setattr(document_module, 'open_pdf', record)
+        with pytest.raises(PDFSyntaxError):
+            Document(path)
+        assert opened[0].closed
+
+    def test_returns_same_tables_as_extract_table(self) -> None:
+        path = os.path.join(SAMPLES, '05_table_borders.pdf')
+        with open(path, 'rb') as file:
+            expected = extract_table(extract_pages(file))
+        with Document(path) as document:
+            pd.testing.assert_frame_equal(document.tables(), expected)
+
+
+class TestCompositeDevice():
+
+    def test_forwards_each_layout_to_every_receiver(self) -> None:
+        with open(os.path.join(SAMPLES, '00_pages.pdf'), 'rb') as file:
+            document = PDFDocument(PDFParser(file))
+            rsrcmgr = PDFResourceManager()
+            receivers = [PDFPageAggregator(rsrcmgr), PDFPageAggregator(rsrcmgr)]
+            device = CompositeDevice(rsrcmgr, *receivers)
+            interpreter = PDFPageInterpreter(rsrcmgr, device)
+            for page in PDFPage.create_pages(document):
+                interpreter.process_page(page)
+                assert receivers[0].get_result() is receivers[1].get_result()
@@ -0,0 +1,60 @@
+# tests/integration/test_pdfminer_models.py
+
+# Third-Party Imports
+import numpy as np
+from pdfminer.layout import LTPage
+import pytest
+
+# Local Imports
+from src.parser.abstractors import get_position
+from src.parser.models.page import CompactPage, CHARACTER, TEXTBOX, TEXTLINE
+from src.parser.reducers import reduce_fontsizes
+from src.parser.selectors import select_lines, select_textboxes
+
+
+class TestCompactPage():
+
+    @pytest.fixture(autouse=True)
+    def table(self, table_borders):
+        return table_borders[0]
+
+    def test_contains_an_entry_for_each_item(self, table) -> None:
+        result = CompactPage.from_layout(table)
+        assert isinstance(result.bboxes, np.ndarray)
+        assert len(result.select(TEXTLINE, parent_kind=TEXTBOX)) == len(select_lines(table))
+        assert len(result.select(TEXTBOX)) == len(select_textboxes(table))
+
+    def test_returns_text_of_lines(self, table) -> None:
+        result = CompactPage.from_layout(table)
+        expected = [line.get_text() for line in select_lines(table)]
+        actual = [result.get_text(index) for index in result.select(TEXTLINE, parent_kind=TEXTBOX)]
+        assert actual == expected
+
+    def test_returns_positions_of_lines(self, table) -> None:
+        result = CompactPage.from_layout(table)
+        expected = [get_position(line) for line in select_lines(table)]
+        actual = result.positions(result.select(TEXTLINE, parent_kind=TEXTBOX))
+        assert actual == expected
+
+    def test_selects_lines_within_boundary(self, table) -> None:
+        result = CompactPage.from_layout(table)
+        indexes = result.select(TEXTLINE, (259.6, 706.0, 352.7, 719.5), margin=1, parent_kind=TEXTBOX)
+        assert [result.get_text(index).strip() for index in indexes] == ['TestField1']
+
+    def test_returns_fontsizes_of_characters(self, table) -> None:
+        result = CompactPage.from_layout(table)
+        lines = result.select(TEXTLINE, parent_kind=TEXTBOX)
+        characters = np.flatnonzero(np.isin(result.parents, lines) & (result.kinds == CHARACTER))
+        expected = reduce_fontsizes([], table)
+        actual = result.fontsizes(characters)
+        assert actual == expected
+
+    def test_groups_long_chains_of_lines_into_one_textbox(self) -> None:
+        count = 2000
+        page = LTPage(1, (0, 0, 100, count * 12))
+        bboxes = np.array([(0, idx * 12, 10, idx * 12 + 10) for idx in range(count)], dtype=np.float64)
+        result = CompactPage.from_glyphs(
+            page, bboxes, np.full(count, 10.0), ['Font'] * count, ['x'] * count
+        )
+        assert len(result.select(TEXTBOX)) == 1
+        assert len(result.select(TEXTLINE, parent_kind=TEXTBOX)) == count
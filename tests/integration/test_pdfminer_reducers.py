@@ -4,6 +4,9 @@
 import pytest
 
 # Local Imports
+from src.parser import callbacks
+from src.parser.models.page import CompactPage
+from src.parser.reducers import reduce_positions
 from src.parser.reducers.design import reduce_fontnames
 from src.parser.reducers.design import reduce_fontsizes
 from src.parser.reducers.design import reduce_fontweights
@@ -88,3 +91,28 @@ class TestReduceTypefaces():
         actual = reduce_typefaces(set(), fonts)
         expected = set(['ArialMT', 'Calibri', 'Georgia'])
         assert not actual.difference(expected)
+
+
+class TestReducingCompactPages():
+
+    @pytest.fixture(scope="function", params=[i for i in range(3)])
+    def page(self, request, fonts):
+        yield fonts[request.param]
+
+    @pytest.fixture(params=[reduce_fontnames, reduce_fontsizes, reduce_fontweights, reduce_typefaces])
+    def reducer(self, request):
+        return request.param
+
+    def test_returns_same_values_as_page(self, page, reducer) -> None:
+        compact = CompactPage.from_layout(page)
+        assert reducer([], compact) == reducer([], page)
+        assert reducer(dict(), compact) == reducer(dict(), page)
+
+    def test_filters_characters_with_positional_callbacks(self, page, reducer) -> None:
+        compact = CompactPage.from_layout(page)
+        callback = callbacks.within((0, 600, 600, 800))
+        assert reducer(set(), compact, callback) == reducer(set(), page, callback)
+
+    def test_returns_positions_of_items_on_page(self, page) -> None:
+        compact = CompactPage.from_layout(page)
+        assert reduce_positions([], compact) == reduce_positions([], page)
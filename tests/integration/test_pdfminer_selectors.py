@@ -8,11 +8,19 @@ from pdfminer.layout import LTChar, LTPage, LTRect, LTTextBox, LTTextLine
 import pytest
 
 # Local Imports
+from src.parser import callbacks
+from src.parser.abstractors import get_position
+from src.parser.models.page import CompactPage
 from src.parser.selectors import select_pages
 from src.parser.selectors import select_textboxes
 from src.parser.selectors import select_rectangles
 from src.parser.selectors import select_lines
 from src.parser.selectors import select_characters
+from src.parser.selectors import iter_characters
+from src.parser.selectors import iter_lines
+from src.parser.selectors import iter_rectangles
+from src.parser.selectors import iter_textboxes
+from src.parser.selectors.buckets import bucket_page
 
 
 class TestSelectPages():
@@ -202,3 +210,150 @@ class TestSelectCharacters():
         callbacks = [lambda box:  "z" in box.get_text()]
         result = list(select_lines(text, *callbacks))
         assert len(result) == 0
+
+
+class TestBucketPage():
+
+    def test_returns_same_buckets_for_same_page(self, table_borders) -> None:
+        assert bucket_page(table_borders[0]) is bucket_page(table_borders[0])
+
+    def test_buckets_match_selectors(self, table_borders) -> None:
+        result = bucket_page(table_borders[0])
+        assert result['textboxes'] == [obj for obj in table_borders[0] if isinstance(obj, LTTextBox)]
+        assert result['rectangles'] == [obj for obj in table_borders[0] if isinstance(obj, LTRect)]
+        assert all(map(lambda ln: isinstance(ln, LTTextLine), result['lines']))
+        assert all(map(lambda ch: isinstance(ch, LTChar), result['characters']))
+
+
+class TestSelectByRegion():
+
+    @pytest.fixture(autouse=True)
+    def table(self, table_borders):
+        return table_borders[0]
+
+    def test_returns_same_lines_as_within_callback(self, table) -> None:
+        boundary = (258.6, 705.0, 353.7, 720.5)
+        expected = select_lines(table, callbacks.within(boundary))
+        actual = select_lines(table, region=boundary)
+        assert actual == expected
+        assert len(actual) == 1
+
+    def test_returns_same_characters_as_within_callback(self, table) -> None:
+        boundary = (258.6, 705.0, 353.7, 720.5)
+        expected = select_characters(table, callbacks.within(boundary))
+        actual = select_characters(table, region=boundary)
+        assert actual == expected
+
+    def test_returns_nothing_outside_page(self, table) -> None:
+        result = select_lines(table, region=(1000, 1000, 1100, 1100))
+        assert result == []
+
+
+class TestIterSelectors():
+
+    @pytest.fixture(autouse=True)
+    def table(self, table_borders):
+        return table_borders[0]
+
+    def test_yields_same_items_as_selectors(self, table) -> None:
+        assert list(iter_textboxes(table)) == select_textboxes(table)
+        assert list(iter_rectangles(table)) == select_rectangles(table)
+        assert list(iter_lines(table)) == select_lines(table)
+        assert list(iter_characters(table)) == select_characters(table)
+
+    def test_yields_same_items_as_selectors_with_callbacks(self, table) -> None:
+        not_blank = callbacks.text.not_blank()
+        assert list(iter_lines(list(table), not_blank)) == select_lines(list(table), not_blank)
+
+    def test_returns_generator(self, table) -> None:
+        result = iter_lines(table)
+        assert next(result) is select_lines(table)[0]
+
+    def test_stops_walking_after_first_match(self, table) -> None:
+        visited = []
+
+        def record(char):
+            visited.append(char)
+            return True
+
+        assert any(iter_characters(table, record))
+        assert len(visited) == 1
+
+    def test_raises_error_when_iterated_with_invalid_argument(self) -> None:
+        with pytest.raises(TypeError):
+            next(iter_lines(1))
+
+
+class TestCallbacksBuiltOncePerCall():
+    # Selecting from lists once rebuilt the callbacks for every element,
+    # which made nested inputs slower than before they were fused
+
+    @pytest.fixture(autouse=True)
+    def built(self, monkeypatch) -> list:
+        built = []
+        for name in ('compose', 'within', 'intersects'):
+            factory = getattr(callbacks, name)
+            monkeypatch.setattr(
+                callbacks, name,
+                lambda *args, factory=factory, name=name, **kwargs: built.append(name) or factory(*args, **kwargs)
+            )
+        return built
+
+    @pytest.fixture(params=[select_lines, select_characters])
+    def selector(self, request):
+        return request.param
+
+    @pytest.fixture(params=[iter_textboxes, iter_rectangles, iter_lines, iter_characters])
+    def iterator(self, request):
+        return request.param
+
+    def test_selectors_build_callbacks_once(self, built, selector, table_borders) -> None:
+        items = [item for page in table_borders for item in page]
+        selector(items, callbacks.text.not_blank())
+        assert built == ['compose']
+
+    def test_selectors_build_region_callbacks_once(self, built, selector, table_borders) -> None:
+        selector(list(table_borders), region=(0, 600, 600, 800))
+        assert sorted(built) == ['compose', 'intersects', 'within']
+
+    def test_iterators_build_callbacks_once(self, built, iterator, table_borders) -> None:
+        list(iterator([item for page in table_borders for item in page]))
+        assert built == ['compose']
+
+
+class TestSelectingFromCompactPages():
+
+    @pytest.fixture(scope="function", params=[i for i in range(5)])
+    def border(self, request, table_borders):
+        yield table_borders[request.param]
+
+    @pytest.fixture(params=[select_textboxes, select_rectangles, select_lines, select_characters])
+    def selector(self, request):
+        return request.param
+
+    def test_returns_indexes_of_same_items_as_page(self, border, selector) -> None:
+        compact = CompactPage.from_layout(border)
+        expected = [get_position(item) for item in selector(border)]
+        assert compact.positions(selector(compact)) == expected
+
+    def test_filters_indexes_with_positional_callbacks(self, border, selector) -> None:
+        compact = CompactPage.from_layout(border)
+        callback = callbacks.within((0, 700, 600, 800))
+        expected = [get_position(item) for item in selector(border, callback)]
+        assert compact.positions(selector(compact, callback)) == expected
+
+    def test_filters_indexes_by_region(self, border) -> None:
+        compact = CompactPage.from_layout(border)
+        region = (259.6, 692.2, 352.7, 719.5)
+        expected = [get_position(line) for line in select_lines(border, region=region)]
+        assert compact.positions(select_lines(compact, region=region)) == expected
+
+    def test_iterators_yield_same_indexes_as_selectors(self, border) -> None:
+        compact = CompactPage.from_layout(border)
+        assert list(iter_lines(compact)) == select_lines(compact).tolist()
+        assert list(iter_characters(compact)) == select_characters(compact).tolist()
+
+    def test_raises_error_for_callbacks_which_are_not_positional(self, border) -> None:
+        compact = CompactPage.from_layout(border)
+        with pytest.raises(ValueError):
+            select_lines(compact, callbacks.text.not_blank())
@@ -0,0 +1,79 @@
+# tests/integration/test_pdfminer_typography.py
+
+# Standard Imports
+import gc
+import os
+import statistics
+import weakref
+
+# Third-Party Imports
+import pytest
+
+# Local Imports
+from src.parser.extractors import extract_pages
+from src.parser.reducers.design import reduce_fontnames
+from src.parser.reducers.design import reduce_fontsizes
+from src.parser.reducers.design import reduce_fontweights
+from src.parser.reducers.design import reduce_typefaces
+from src.parser.selectors import select_lines
+from src.parser.utils.typography import TypographyProfile
+from src.parser.utils.typography import most_common_fontname
+from src.parser.utils.typography import most_common_fontsize
+from src.parser.utils.typography import most_common_fonts_by_line
+from src.parser.utils.typography import profile_typography
+
+
+class TestTypographyProfile():
+
+    def test_counts_match_reducers(self, fonts) -> None:
+        profile = TypographyProfile.from_container(fonts)
+        assert profile.fontnames == reduce_fontnames({}, fonts)
+        assert profile.fontsizes == reduce_fontsizes({}, fonts)
+        assert profile.fontweights == reduce_fontweights({}, fonts)
+        assert profile.typefaces == reduce_typefaces({}, fonts)
+
+    def test_keeps_profile_of_each_page_and_line(self, table_borders) -> None:
+        profile = TypographyProfile.from_container(table_borders)
+        assert list(profile.pages) == list(table_borders)
+        assert list(profile.lines) == select_lines(table_borders)
+
+    def test_most_common_values_match_statistics_mode(self, table_borders) -> None:
+        for line in select_lines(table_borders):
+            assert most_common_fontname(line) == statistics.mode(reduce_fontnames([], line))
+            assert most_common_fontsize(line) == statistics.mode(reduce_fontsizes([], line))
+
+    def test_reuses_profiles_of_lines_within_page(self, table_borders) -> None:
+        page_profile = profile_typography(table_borders[0])
+        line = select_lines(table_borders[0])[0]
+        assert profile_typography(line) is page_profile.lines[line]
+
+    def test_releases_page_after_profiling(self) -> None:
+        page = next(extract_pages(os.path.join('tests', 'samples', '05_table_borders.pdf')))
+        most_common_fontname(page)
+        reference = weakref.ref(page)
+        del page
+        gc.collect()
+        assert reference() is None
+
+    def test_raises_error_when_container_has_no_characters(self) -> None:
+        with pytest.raises(statistics.StatisticsError):
+            TypographyProfile.from_container([]).most_common_fontname()
+
+
+class TestMostCommonFontsByLine():
+
+    @pytest.fixture(params=['fonts', 'table_borders', 'table_headers'])
+    def lines(self, request):
+        return select_lines(request.getfixturevalue(request.param))
+
+    def test_matches_statistics_mode(self, lines) -> None:
+        result = most_common_fonts_by_line(lines)
+        for line in lines:
+            expected = (
+                statistics.mode(reduce_fontnames([], line)),
+                statistics.mode(reduce_fontsizes([], line)),
+            )
+            assert result[line] == expected
+
+    def test_returns_empty_dict_without_lines(self) -> None:
+        assert most_common_fonts_by_line([]) == {}
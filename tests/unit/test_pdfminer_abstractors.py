@@ -9,6 +9,7 @@ from src.parser.abstractors import get_fontsize
 from src.parser.abstractors import get_fontweight
 from src.parser.abstractors import get_typeface
 from src.parser.abstractors import get_position
+from src.parser.abstractors import get_normalized_text
 
 
 @dataclass(frozen=True)
@@ -28,6 +29,11 @@ class TestGetFontname:
         result = get_fontname(char)
         assert result == "Arial-Bold"
 
+    def test_returns_shared_string_for_same_font(self):
+        first = Char("".join(["BCDEEE+", "Arial-Bold"]), 12)
+        second = Char("".join(["BCDEEE+", "Arial-Bold"]), 10)
+        assert get_fontname(first) is get_fontname(second)
+
 
 class TestGetFontsize:
     def setUp(self) -> None:
@@ -55,6 +61,11 @@ class TestGetFontweight:
         result = get_fontweight(char)
         assert result == "Bold"
 
+    def test_returns_regular_when_fontname_has_no_weight(self):
+        char = Char("BCDEEE+ArialMT", 10)
+        result = get_fontweight(char)
+        assert result == "Regular"
+
 
 class TestGetTypeface:
     def setUp(self) -> None:
@@ -89,3 +100,34 @@ class TestGetPosition:
         bbox = Bbox(0, 10, 10, 0)
         result = get_position(bbox)
         assert result == (0, 10, 10, 0)
+
+
+class Container:
+    def __init__(self, text: str = ''):
+        self.text = text
+        self.calls = 0
+
+    def get_text(self):
+        self.calls += 1
+        return self.text
+
+
+class TestGetNormalizedText:
+    def test_returns_normalized_text(self):
+        container = Container(" a\nb \n")
+        result = get_normalized_text(container)
+        assert result == "ab"
+
+    def test_builds_text_once(self):
+        container = Container("abc")
+        get_normalized_text(container)
+        get_normalized_text(container)
+        assert container.calls == 1
+
+    def test_returns_text_for_uncacheable_objects(self):
+        class Unhashable(Container):
+            __hash__ = None
+
+        container = Unhashable("abc\n")
+        result = get_normalized_text(container)
+        assert result == "abc"
@@ -2,6 +2,7 @@
 
 # Local Imports
 from src.parser.analyzers.alignment import determine_alignment
+from src.parser.analyzers.alignment import determine_alignments
 from src.parser.analyzers.distribution import determine_distribution
 from src.parser.analyzers.divisions import determine_column_positions
 from src.parser.analyzers.divisions import determine_row_positions
@@ -45,6 +46,31 @@ class TestDetermineAlignment():
         assert result == 'bottom'
 
 
+class TestDetermineAlignments():
+
+    def test_returns_alignment_for_each_column(self) -> None:
+        test_positions = [
+            (0, 40, 10, 50), (0, 30, 6, 40), (0, 20, 30, 30),
+            (40, 40, 50, 50), (44, 30, 50, 40), (20, 20, 50, 30),
+        ]
+        result = determine_alignments(test_positions, [(0, 30), (20, 50)], axis=1)
+        assert result == ['left', 'right']
+
+    def test_returns_alignment_for_each_row(self) -> None:
+        test_positions = [
+            (40, 40, 50, 50), (30, 44, 40, 50), (20, 20, 30, 50),
+            (0, 0, 10, 14), (10, 0, 20, 20), (20, 0, 30, 6),
+        ]
+        result = determine_alignments(test_positions, [(20, 50), (0, 20)], axis=0)
+        assert result == ['top', 'bottom']
+
+    def test_matches_determine_alignment(self) -> None:
+        test_positions = [(10, 40, 20, 50), (12, 30, 18, 40), (0, 20, 30, 30), (5, 10, 25, 20), (8, 0, 22, 10)]
+        expected = determine_alignment(*test_positions)
+        result = determine_alignments(test_positions, [(0, 30)])
+        assert result == [expected]
+
+
 class TestDetermineDistribution():
 
     def test_returns_string_value_when_positions_aligned(self) -> None:
@@ -62,6 +88,16 @@ class TestDetermineDistribution():
         result = determine_distribution(*test_positions)
         assert result == 'vertical'
 
+    def test_returns_none_when_positions_are_scattered(self) -> None:
+        test_positions = [(0, 0, 10, 10), (10, 10, 20, 20), (20, 20, 30, 30)]
+        result = determine_distribution(*test_positions)
+        assert result is None
+
+    def test_returns_vertical_for_large_columns(self) -> None:
+        test_positions = [(0, 12 * i, 50 + i % 7, 12 * i + 10) for i in range(2000)]
+        result = determine_distribution(*test_positions)
+        assert result == 'vertical'
+
 
 class TestDetermineColumnPositions():
 
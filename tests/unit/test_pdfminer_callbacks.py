@@ -2,6 +2,11 @@
 
 # Standard Imports
 from dataclasses import dataclass
+import random
+
+# Third-Party Imports
+import numpy as np
+import pytest
 
 # Local Imports
 from src.parser import callbacks
@@ -90,6 +95,19 @@ class TestCallbackWithin():
         assert result is True
 
 
+class TestCallbackIntersects():
+
+    def test_returns_true_if_overlapping_boundary(self) -> None:
+        test_element = LayoutItem(5, 5, 15, 15)
+        callback = callbacks.intersects((10, 10, 20, 20))
+        assert callback(test_element) is True
+
+    def test_returns_false_if_outside_boundary(self) -> None:
+        test_element = LayoutItem(0, 0, 10, 10)
+        callback = callbacks.intersects((15, 15, 25, 25))
+        assert callback(test_element) is False
+
+
 class TestCallbackTextEquals():
 
     def test_returns_boolean(self) -> None:
@@ -193,3 +211,65 @@ class TestCallbackTextNotBlank():
         callback = callbacks.text.not_blank()
         result = callback(test_element)
         assert result is False
+
+
+class TestCallbackCompose():
+
+    def test_returns_true_without_callbacks(self) -> None:
+        callback = callbacks.compose()
+        assert callback(LayoutItem(10, 0, 20, 40)) is True
+
+    def test_returns_composed_callback_unchanged(self) -> None:
+        callback = callbacks.compose(callbacks.within((0, 0, 50, 50)))
+        assert callbacks.compose(callback) is callback
+
+    def test_matches_individual_callbacks(self) -> None:
+        rng = random.Random(0)
+        test_callbacks = [
+            callbacks.within((10, 10, 60, 60), margin=1),
+            callbacks.between((5, 40), axis=1),
+            callbacks.between((0, 55), axis=0, margin=2),
+            callbacks.intersects((20, 20, 30, 30)),
+        ]
+        for _ in range(500):
+            x0, y0 = rng.randint(0, 60), rng.randint(0, 60)
+            item = LayoutItem(x0, y0, x0 + rng.randint(0, 20), y0 + rng.randint(0, 20))
+            chosen = rng.sample(test_callbacks, rng.randint(1, len(test_callbacks)))
+            expected = all(map(lambda cb: cb(item), chosen))
+            assert callbacks.compose(*chosen)(item) is expected
+
+    def test_combines_text_callbacks(self) -> None:
+        callback = callbacks.compose(callbacks.text.not_blank(), callbacks.text.includes('b'))
+        assert callback(Container('abc')) is True
+        assert callback(Container('ac')) is False
+        assert callback(Container('\n')) is False
+
+    def test_combines_length_callbacks(self) -> None:
+        callback = callbacks.compose(callbacks.length.greater_than(1), callbacks.length.less_than(4))
+        assert callback([1, 2]) is True
+        assert callback([1]) is False
+        assert callback([1, 2, 3, 4]) is False
+
+    def test_calls_other_callbacks(self) -> None:
+        callback = callbacks.compose(callbacks.text.not_blank(), lambda item: item.get_text() == 'a')
+        assert callback(Container('a')) is True
+        assert callback(Container('b')) is False
+
+    def test_raises_error_when_item_has_no_position(self) -> None:
+        callback = callbacks.compose(callbacks.within((0, 0, 10, 10)))
+        with pytest.raises(ValueError):
+            callback(Container())
+
+
+class TestCallbackMask():
+
+    def test_matches_composed_callback(self) -> None:
+        bboxes = np.array([(0, 0, 5, 5), (2, 2, 8, 8), (9, 9, 20, 20)])
+        test_callbacks = [callbacks.within((0, 0, 10, 10)), callbacks.intersects((4, 4, 6, 6))]
+        composed = callbacks.compose(*test_callbacks)
+        expected = [composed(LayoutItem(*bbox)) for bbox in bboxes.tolist()]
+        assert callbacks.mask(bboxes, *test_callbacks).tolist() == expected
+
+    def test_raises_error_for_text_callbacks(self) -> None:
+        with pytest.raises(ValueError):
+            callbacks.mask(np.zeros((1, 4)), callbacks.text.not_blank())
@@ -1,8 +1,22 @@
 # tests/unit/test_pdfminer_utils.py
 
+# Standard Imports
+from dataclasses import dataclass
+
 # Local Imports
+from src.parser import callbacks
 from src.parser.utils import positions
 from src.parser.utils import merge_overlapping_positions
+from src.parser.utils import SpatialIndex
+from src.parser.utils import IntervalSet
+
+
+@dataclass(frozen=True)
+class LayoutItem:
+    x0: int
+    y0: int
+    x1: int
+    y1: int
 
 
 class TestMergeOverlappingPositions():
@@ -30,3 +44,83 @@ class TestMergeOverlappingPositions():
             (72.025, 72.525), (539.73, 540.23)
         ])
         assert actual == expected
+
+    def test_merges_chains_of_overlapping_positions(self):
+        result = merge_overlapping_positions(*[(20, 30), (0, 10), (9, 21), (40, 50)])
+        assert result == [(0, 30), (40, 50)]
+
+    def test_merges_overlapping_boxes(self):
+        result = merge_overlapping_positions(*[
+            (0, 0, 10, 10), (5, 5, 15, 15), (30, 30, 40, 40), (0, 30, 10, 40)
+        ])
+        assert result == [(0, 0, 15, 15), (0, 30, 10, 40), (30, 30, 40, 40)]
+
+    def test_merges_boxes_which_overlap_after_merging(self):
+        result = merge_overlapping_positions(*[
+            (0, 0, 100, 10), (5, 50, 6, 60), (10, 5, 12, 55)
+        ])
+        assert result == [(0, 0, 100, 60)]
+
+    def test_keeps_boxes_apart_when_only_columns_overlap(self):
+        result = merge_overlapping_positions(*[(0, 50, 10, 60), (0, 0, 10, 5)])
+        assert result == [(0, 0, 10, 5), (0, 50, 10, 60)]
+
+    def test_returns_boxes_which_do_not_touch(self):
+        result = merge_overlapping_positions(*[
+            (x, y, x + 6, y + 6) for x in range(0, 60, 7) for y in range(0, 60, 13)
+        ] + [(3, 3, 4, 60)])
+        for idx, first in enumerate(result):
+            for second in result[idx + 1:]:
+                assert (
+                    first[2] < second[0] or second[2] < first[0]
+                    or first[3] < second[1] or second[3] < first[1]
+                )
+
+    def test_merges_stacked_boxes(self):
+        result = merge_overlapping_positions(*[(0, idx, 10, idx + 1) for idx in range(5000)])
+        assert result == [(0, 0, 10, 5000)]
+
+
+class TestSpatialIndex():
+
+    def test_returns_items_within_boundary(self):
+        items = [LayoutItem(0, 0, 10, 10), LayoutItem(20, 0, 30, 10), LayoutItem(0, 20, 10, 30)]
+        result = SpatialIndex(items).within((0, 0, 15, 15))
+        assert result == [items[0]]
+
+    def test_returns_items_in_original_order(self):
+        items = [LayoutItem(0, 20, 10, 30), LayoutItem(0, 0, 10, 10), LayoutItem(0, 10, 10, 20)]
+        result = SpatialIndex(items).within((0, 0, 10, 30))
+        assert result == items
+
+    def test_matches_within_callback(self):
+        items = [LayoutItem(x, y, x + 8, y + 8) for x in range(0, 50, 5) for y in range(0, 50, 5)]
+        boundary = (10, 10, 30, 30)
+        expected = list(filter(callbacks.within(boundary, margin=1), items))
+        actual = SpatialIndex(items).within(boundary, margin=1)
+        assert actual == expected
+
+
+class TestIntervalSet():
+
+    def test_keeps_intervals_sorted_without_duplicates(self):
+        intervals = IntervalSet([(5, 6), (0, 2), (5, 6)])
+        intervals.add((3, 4))
+        assert list(intervals) == [(0, 2), (3, 4), (5, 6)]
+        assert (3, 4) in intervals
+
+    def test_returns_intervals_within_boundary(self):
+        intervals = IntervalSet([(0, 2), (1, 3), (3, 9), (4, 5)])
+        result = intervals.within((1, 5))
+        assert result == [(1, 3), (4, 5)]
+        assert result == [pos for pos in intervals if callbacks.between((1, 5), axis=0)(pos)]
+
+    def test_returns_overlapping_intervals(self):
+        intervals = IntervalSet([(0, 10), (2, 3), (6, 7), (11, 12)])
+        result = intervals.overlapping((5, 8))
+        assert result == [(0, 10), (6, 7)]
+
+    def test_replaces_parent_containing_multiple_children(self):
+        intervals = IntervalSet([(0, 10), (20, 30)])
+        intervals.replace_parents([(1, 4), (5, 9), (21, 29)])
+        assert list(intervals) == [(1, 4), (5, 9), (20, 30), (21, 29)]